@@ -1,6 +1,8 @@
 from __future__ import annotations
 
+import os
 import subprocess
+from functools import lru_cache
 from pathlib import Path
 
 from hatchling.builders.hooks.plugin.interface import BuildHookInterface
@@ -8,13 +10,16 @@ from hatchling.builders.hooks.plugin.interface import BuildHookInterface
 
 class VersionBuildHook(BuildHookInterface):
     def initialize(self, version: str, build_data: dict) -> None:
-        repo_root = Path(self.root)
-        target = repo_root / "src" / "nibterm" / "version.py"
-        git_version = _describe_git(repo_root)
-        target.write_text(f'__version__ = "{git_version}"\n', encoding="utf-8")
+        target = Path(self.root) / "src" / "nibterm" / "version.py"
+        git_version = _describe_git(self.root)
+        # Write via a temp file so concurrent builds never see a partial file.
+        tmp = target.with_name(f"{target.name}.{os.getpid()}.tmp")
+        tmp.write_bytes(f'__version__ = "{git_version}"\n'.encode("ascii", errors="replace"))
+        os.replace(tmp, target)
 
 
-def _describe_git(repo_root: Path) -> str:
+@lru_cache(maxsize=1)
+def _describe_git(repo_root: str) -> str:
     try:
         output = subprocess.check_output(
             ["git", "describe", "--tags", "--dirty", "--always"],
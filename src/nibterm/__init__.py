@@ -1,3 +1,12 @@
-from .main import main
-
 __all__ = ["main"]
+
+
+def __getattr__(name: str):
+    # Import the Qt entry point on first use so that importing nibterm.config
+    # and friends does not pull in PySide6.
+    if name == "main":
+        from .main import main
+
+        globals()["main"] = main
+        return main
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,118 @@
+"""QSettings with an in-memory read cache and change-only writes.
+
+Every ``QSettings.value`` call goes back to the backing store (INI file or
+registry) and every ``setValue`` is written even when the value is
+unchanged.  ``CachedSettings`` remembers what it has read or written so the
+window, the dataclass ``from_qsettings`` helpers and the variable manager
+can share one instance without paying for repeated lookups, and
+``sync`` only touches the store when something was actually written.
+With a :class:`SettingsWriter` attached, that disk flush (explicit or the
+one QSettings schedules itself after a write) runs on the writer's thread.
+
+Keys are cached under their full path (current group / array index
+included), so ``beginGroup`` / ``beginReadArray`` callers keep working.
+Code that writes through a separate ``QSettings`` instance must call
+:meth:`CachedSettings.invalidate` for the affected keys.
+"""
+from __future__ import annotations
+
+from copy import deepcopy
+from typing import Any
+
+from PySide6.QtCore import QEvent, QMetaObject, QObject, QSettings, Qt, Slot
+
+_MISSING = object()
+
+
+class SettingsWriter(QObject):
+    """Flushes a settings file to disk; meant to live on its own ``QThread``.
+
+    Instances of QSettings for the same file share one in-memory store, so
+    syncing a private instance here writes out whatever the GUI thread set.
+    """
+
+    def __init__(self, file_name: str, fmt: QSettings.Format) -> None:
+        super().__init__()
+        self._file_name = file_name
+        self._format = fmt
+        self._settings: QSettings | None = None
+
+    @Slot()
+    def sync(self) -> None:
+        if self._settings is None:
+            self._settings = QSettings(self._file_name, self._format)
+        self._settings.sync()
+
+
+class CachedSettings(QSettings):
+    """Drop-in ``QSettings`` that caches ``value`` and skips no-op writes."""
+
+    def __init__(self, *args: Any) -> None:
+        super().__init__(*args)
+        # full key -> {requested type: converted value, or _MISSING}
+        self._cache: dict[str, dict[type | None, Any]] = {}
+        self._dirty = False
+        self._writer: SettingsWriter | None = None
+
+    def set_writer(self, writer: SettingsWriter | None) -> None:
+        """Hand disk flushes to *writer* (``None`` flushes on the calling thread again)."""
+        self._writer = writer
+
+    def _full_key(self, key: str) -> str:
+        group = self.group()
+        return f"{group}/{key}" if group else key
+
+    def value(self, key: str, defaultValue: Any = None, type: type | None = None) -> Any:
+        by_type = self._cache.setdefault(self._full_key(key), {})
+        try:
+            cached = by_type[type]
+        except KeyError:
+            if not super().contains(key):
+                cached = _MISSING
+            elif type is None:
+                cached = super().value(key)
+            else:
+                cached = super().value(key, defaultValue, type)
+            by_type[type] = cached
+        # Hand out copies so that editing a returned list in place cannot
+        # change the cache (and make the next setValue look like a no-op).
+        return defaultValue if cached is _MISSING else deepcopy(cached)
+
+    def setValue(self, key: str, value: Any) -> None:
+        full_key = self._full_key(key)
+        by_type = self._cache.get(full_key)
+        if by_type is not None and by_type.get(None, _MISSING) == value:
+            return
+        super().setValue(key, value)
+        # The caller may keep mutating *value*; cache a snapshot of it.
+        self._cache[full_key] = {None: deepcopy(value)}
+        self._dirty = True
+
+    def remove(self, key: str) -> None:
+        super().remove(key)
+        # Removing a key also removes every key below it.
+        self._cache.clear()
+        self._dirty = True
+
+    def sync(self) -> None:
+        """Flush to the backing store, unless nothing was written since the last sync."""
+        if not self._dirty:
+            return
+        self._dirty = False
+        if self._writer is None:
+            super().sync()
+        else:
+            QMetaObject.invokeMethod(self._writer, "sync", Qt.ConnectionType.QueuedConnection)
+
+    def event(self, event: QEvent) -> bool:
+        # QSettings posts itself an UpdateRequest after each write and syncs
+        # when it arrives; route that through sync() so the writer does it.
+        if event.type() == QEvent.Type.UpdateRequest and self._writer is not None:
+            self.sync()
+            return True
+        return super().event(event)
+
+    def invalidate(self, *keys: str) -> None:
+        """Forget cached values for *keys* (relative to the current group)."""
+        for key in keys:
+            self._cache.pop(self._full_key(key), None)
@@ -1,12 +1,23 @@
 from __future__ import annotations
 
+import operator
+import os
+import sys
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 
 import yaml
 
+try:
+    from yaml import CSafeLoader as _Loader
+except ImportError:  # libyaml not available
+    from yaml import SafeLoader as _Loader
 
-@dataclass
+_command_fields = operator.itemgetter("label", "command")
+
+
+@dataclass(slots=True)
 class CommandParam:
     name: str
     label: str | None = None
@@ -14,7 +25,7 @@ class CommandParam:
     description: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class CommandOption:
     flag: str
     label: str | None = None
@@ -23,7 +34,7 @@ class CommandOption:
     description: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class Command:
     label: str
     command: str
@@ -33,15 +44,28 @@ class Command:
     description: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class CommandPreset:
     name: str
     commands: list[Command]
 
 
 def load_preset(path: str | Path) -> CommandPreset:
-    path = Path(path)
-    raw = yaml.safe_load(path.read_text(encoding="utf-8"))
+    """Load a preset file, reusing the parsed result while the file is unchanged.
+
+    The returned preset is shared between callers and must not be mutated.
+    """
+    path_str = os.path.realpath(os.fspath(path))
+    st = os.stat(path_str)
+    return _load_preset_cached(path_str, st.st_mtime_ns, st.st_size)
+
+
+@lru_cache(maxsize=64)
+def _load_preset_cached(path_str: str, mtime_ns: int, size: int) -> CommandPreset:
+    # mtime_ns and size are only part of the cache key: an edited file
+    # produces a new key and is parsed again.
+    with open(path_str, "rb") as f:
+        raw = yaml.load(f, Loader=_Loader)
     if not isinstance(raw, dict):
         raise ValueError("Preset file must be a YAML mapping.")
 
@@ -52,94 +76,81 @@ def load_preset(path: str | Path) -> CommandPreset:
     if not isinstance(commands, list):
         raise ValueError("Preset must include a 'commands' list.")
 
-    parsed: list[Command] = []
-    for entry in commands:
-        if not isinstance(entry, dict):
-            raise ValueError("Each command must be a mapping with label and command.")
-        label = entry.get("label")
-        command = entry.get("command")
-        color = entry.get("color")
-        params_raw = entry.get("params", [])
-        options_raw = entry.get("options", [])
-        description = entry.get("description")
-        if not isinstance(label, str) or not isinstance(command, str):
-            raise ValueError("Command entries must include 'label' and 'command' strings.")
-        if color is not None and not isinstance(color, str):
-            raise ValueError("'color' must be a string if provided.")
-        if description is not None and not isinstance(description, str):
-            raise ValueError("'description' must be a string if provided.")
-        params: list[CommandParam] = []
-        if params_raw:
-            if not isinstance(params_raw, list):
-                raise ValueError("'params' must be a list.")
-            for param in params_raw:
-                if not isinstance(param, dict):
-                    raise ValueError("Each param must be a mapping.")
-                param_name = param.get("name")
-                if not isinstance(param_name, str) or not param_name:
-                    raise ValueError("Param must include a non-empty 'name'.")
-                label_text = param.get("label")
-                if label_text is not None and not isinstance(label_text, str):
-                    raise ValueError("'label' must be a string if provided.")
-                default = param.get("default")
-                if default is not None and not isinstance(default, str):
-                    default = str(default)
-                param_description = param.get("description")
-                if param_description is not None and not isinstance(param_description, str):
-                    raise ValueError("'description' must be a string if provided.")
-                params.append(
-                    CommandParam(
-                        name=param_name,
-                        label=label_text,
-                        default=default,
-                        description=param_description,
-                    )
-                )
-        options: list[CommandOption] = []
-        if options_raw:
-            if not isinstance(options_raw, list):
-                raise ValueError("'options' must be a list.")
-            for opt in options_raw:
-                if not isinstance(opt, dict):
-                    raise ValueError("Each option must be a mapping.")
-                flag = opt.get("flag")
-                if not isinstance(flag, str) or not flag.strip():
-                    raise ValueError("Option must include a non-empty 'flag'.")
-                flag = flag.strip()
-                opt_label = opt.get("label")
-                if opt_label is not None and not isinstance(opt_label, str):
-                    raise ValueError("'label' must be a string if provided.")
-                opt_type = opt.get("type", "bool")
-                if opt_type not in ("bool", "value"):
-                    raise ValueError("Option 'type' must be 'bool' or 'value'.")
-                opt_default = opt.get("default")
-                if opt_type == "bool":
-                    if opt_default is not None and not isinstance(opt_default, bool):
-                        raise ValueError("Boolean option 'default' must be true/false if provided.")
-                else:
-                    if opt_default is not None:
-                        opt_default = str(opt_default)
-                opt_description = opt.get("description")
-                if opt_description is not None and not isinstance(opt_description, str):
-                    raise ValueError("'description' must be a string if provided.")
-                options.append(
-                    CommandOption(
-                        flag=flag,
-                        label=opt_label,
-                        type=opt_type,
-                        default=opt_default,
-                        description=opt_description,
-                    )
-                )
-        parsed.append(
-            Command(
-                label=label,
-                command=command,
-                color=color,
-                params=params,
-                options=options,
-                description=description,
-            )
-        )
-
+    parsed = [_parse_command(entry) for entry in commands]
     return CommandPreset(name=preset_name, commands=parsed)
+
+
+def _parse_command(entry: object) -> Command:
+    if not isinstance(entry, dict):
+        raise ValueError("Each command must be a mapping with label and command.")
+    try:
+        label, command = _command_fields(entry)
+    except KeyError:
+        label = command = None
+    if not isinstance(label, str) or not isinstance(command, str):
+        raise ValueError("Command entries must include 'label' and 'command' strings.")
+    return Command(
+        label=label,
+        command=command,
+        color=_optional_str(entry, "color"),
+        params=[_parse_param(p) for p in _optional_list(entry, "params")],
+        options=[_parse_option(o) for o in _optional_list(entry, "options")],
+        description=_optional_str(entry, "description"),
+    )
+
+
+def _parse_param(param: object) -> CommandParam:
+    if not isinstance(param, dict):
+        raise ValueError("Each param must be a mapping.")
+    param_name = param.get("name")
+    if not isinstance(param_name, str) or not param_name:
+        raise ValueError("Param must include a non-empty 'name'.")
+    default = param.get("default")
+    if default is not None and not isinstance(default, str):
+        default = str(default)
+    return CommandParam(
+        name=param_name,
+        label=_optional_str(param, "label"),
+        default=default,
+        description=_optional_str(param, "description"),
+    )
+
+
+def _parse_option(opt: object) -> CommandOption:
+    if not isinstance(opt, dict):
+        raise ValueError("Each option must be a mapping.")
+    flag = opt.get("flag")
+    if not isinstance(flag, str) or not flag.strip():
+        raise ValueError("Option must include a non-empty 'flag'.")
+    opt_type = opt.get("type", "bool")
+    if opt_type not in ("bool", "value"):
+        raise ValueError("Option 'type' must be 'bool' or 'value'.")
+    opt_default = opt.get("default")
+    if opt_type == "bool":
+        if opt_default is not None and not isinstance(opt_default, bool):
+            raise ValueError("Boolean option 'default' must be true/false if provided.")
+    elif opt_default is not None:
+        opt_default = str(opt_default)
+    return CommandOption(
+        flag=sys.intern(flag.strip()),
+        label=_optional_str(opt, "label"),
+        type=sys.intern(opt_type),
+        default=opt_default,
+        description=_optional_str(opt, "description"),
+    )
+
+
+def _optional_str(mapping: dict, key: str) -> str | None:
+    value = mapping.get(key)
+    if value is not None and not isinstance(value, str):
+        raise ValueError(f"'{key}' must be a string if provided.")
+    return value
+
+
+def _optional_list(mapping: dict, key: str) -> list:
+    value = mapping.get(key)
+    if not value:
+        return []
+    if not isinstance(value, list):
+        raise ValueError(f"'{key}' must be a list.")
+    return value
@@ -23,4 +23,5 @@ DEFAULT_PLOT_DELIMITER = ","
 
 DEFAULT_CONSOLE_MAX_BLOCK_COUNT = 5000
 DEFAULT_CONSOLE_TIMESTAMP_COLOR = "#2e7d32"
+DEFAULT_CONSOLE_ECHO_COLOR = "#d32f2f"
 DEFAULT_HISTORY_MAX_LENGTH = 500
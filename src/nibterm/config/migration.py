@@ -9,23 +9,39 @@ This module is called once at startup to migrate:
 from __future__ import annotations
 
 import logging
-
-from PySide6.QtCore import QSettings
+import re
+from typing import TYPE_CHECKING
 
 from . import settings_keys as SK
 from .variable import SerialParserConfig, VariableDefinition, load_variables, save_variables
 
+if TYPE_CHECKING:
+    from PySide6.QtCore import QSettings
+
 logger = logging.getLogger(__name__)
 
 _MIGRATION_KEY = "migration/unified_variables_done"
 
+# Settings stores (by file name) already known to be migrated in this process,
+# so repeat calls skip the QSettings round-trip.
+_migrated: set[str] = set()
+
+# Entries in the old ';'-separated settings strings.  Each pattern is anchored
+# at the start of an entry so malformed entries are skipped, not half-matched.
+_INDEX_RE = re.compile(r"(?:^|;)\s*([+-]?\d+)\s*(?=;|$)")
+_COLUMN_NAME_RE = re.compile(r"(?:^|;)\s*([+-]?\d+)\s*=\s*([^;]*?)\s*(?=;|$)")
+_TRANSFORM_RE = re.compile(r"(?:^|;)\s*([^;=]*?)\s*(?:=\s*([^;]*?))?\s*(?=;|$)")
+
 
 def migrate_settings(settings: QSettings) -> None:
     """Run all pending migrations. Safe to call on every startup."""
-    if settings.value(_MIGRATION_KEY, False, bool):
+    store = settings.fileName()
+    if store in _migrated:
         return
-    _migrate_to_unified_variables(settings)
-    settings.setValue(_MIGRATION_KEY, True)
+    if not settings.value(_MIGRATION_KEY, False, bool):
+        _migrate_to_unified_variables(settings)
+        settings.setValue(_MIGRATION_KEY, True)
+    _migrated.add(store)
 
 
 def _migrate_to_unified_variables(settings: QSettings) -> None:
@@ -37,6 +53,15 @@ def _migrate_to_unified_variables(settings: QSettings) -> None:
 
     variables: list[VariableDefinition] = []
     used_names: set[str] = set()
+    # Next suffix to try per base name, so repeated collisions don't rescan.
+    name_seq: dict[str, int] = {}
+
+    def _uniq(base: str) -> str:
+        n = name_seq.get(base, 1)
+        while (candidate := base if n == 1 else f"{base}_{n}") in used_names:
+            n += 1
+        name_seq[base] = n + 1
+        return candidate
 
     # 1. Migrate serial CSV column names
     old_delimiter = settings.value(SK.PLOT_DELIMITER, ",", str)
@@ -44,39 +69,21 @@ def _migrate_to_unified_variables(settings: QSettings) -> None:
     old_mqtt_indices_str = settings.value(SK.PLOT_MQTT_COLUMN_INDICES, "", str)
 
     # Parse old mqtt indices
-    mqtt_indices: set[int] = set()
-    if old_mqtt_indices_str:
-        for part in old_mqtt_indices_str.split(";"):
-            part = part.strip()
-            if part:
-                try:
-                    mqtt_indices.add(int(part))
-                except ValueError:
-                    pass
+    mqtt_indices: set[int] = {
+        int(m.group(1)) for m in _INDEX_RE.finditer(old_mqtt_indices_str)
+    }
 
     # Parse old column names
     if old_names_str:
-        for entry in old_names_str.split(";"):
-            entry = entry.strip()
-            if not entry or "=" not in entry:
-                continue
-            idx_text, name = entry.split("=", 1)
-            try:
-                idx = int(idx_text.strip())
-            except ValueError:
-                continue
-            name = name.strip()
+        for m in _COLUMN_NAME_RE.finditer(old_names_str):
+            idx = int(m.group(1))
+            name = m.group(2)
             if not name:
                 continue
             # Skip MQTT columns -- they'll be migrated from mqtt/plot_var_*
             if idx in mqtt_indices:
                 continue
-            if name in used_names:
-                # Avoid duplicate names
-                n = 2
-                while f"{name}_{n}" in used_names:
-                    n += 1
-                name = f"{name}_{n}"
+            name = _uniq(name)  # Avoid duplicate names
             variables.append(
                 VariableDefinition(
                     name=name,
@@ -88,17 +95,16 @@ def _migrate_to_unified_variables(settings: QSettings) -> None:
 
     # 2. Migrate MQTT plot variables
     mqtt_count = settings.value(SK.MQTT_PLOT_VAR_COUNT, 0, int)
+    topic_key = SK.MQTT_PLOT_VAR_TOPIC.format
+    path_key = SK.MQTT_PLOT_VAR_PATH.format
+    name_key = SK.MQTT_PLOT_VAR_NAME.format
     for i in range(mqtt_count):
-        topic = settings.value(SK.MQTT_PLOT_VAR_TOPIC.format(i), "", str)
-        path = settings.value(SK.MQTT_PLOT_VAR_PATH.format(i), "", str)
-        name = settings.value(SK.MQTT_PLOT_VAR_NAME.format(i), "", str)
+        topic = settings.value(topic_key(i), "", str)
+        path = settings.value(path_key(i), "", str)
+        name = settings.value(name_key(i), "", str)
         if not name:
             name = f"mqtt_{i}"
-        if name in used_names:
-            n = 2
-            while f"{name}_{n}" in used_names:
-                n += 1
-            name = f"{name}_{n}"
+        name = _uniq(name)
         if topic or path or name:
             variables.append(
                 VariableDefinition(
@@ -113,24 +119,13 @@ def _migrate_to_unified_variables(settings: QSettings) -> None:
     # 3. Migrate transform expressions
     old_transforms_str = settings.value(SK.PLOT_TRANSFORM, "", str)
     if old_transforms_str:
-        for chunk in old_transforms_str.split(";"):
-            chunk = chunk.strip()
-            if not chunk:
-                continue
-            if "=" in chunk:
-                name, expr = chunk.split("=", 1)
-                name = name.strip()
-                expr = expr.strip()
-            else:
-                name = chunk
-                expr = chunk
+        for m in _TRANSFORM_RE.finditer(old_transforms_str):
+            name, expr = m.group(1), m.group(2)
+            if expr is None:
+                expr = name
             if not expr:
                 continue
-            if name in used_names:
-                n = 2
-                while f"{name}_{n}" in used_names:
-                    n += 1
-                name = f"{name}_{n}"
+            name = _uniq(name)
             variables.append(
                 VariableDefinition(
                     name=name or expr,
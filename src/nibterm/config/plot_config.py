@@ -7,15 +7,18 @@ rate).  All variable definitions and parsing configuration live in
 """
 from __future__ import annotations
 
+import re
 from dataclasses import dataclass, field
-
-from PySide6.QtCore import QSettings
+from typing import TYPE_CHECKING
 
 from . import defaults
 from . import settings_keys as SK
 
+if TYPE_CHECKING:
+    from PySide6.QtCore import QSettings
+
 
-@dataclass
+@dataclass(slots=True)
 class PlotConfig:
     mode: str = "timeseries"
     series_variables: list[str] = field(default_factory=list)
@@ -37,17 +40,15 @@ class PlotConfig:
 # ---------------------------------------------------------------------------
 
 
+_SPLIT_RE = re.compile(r"\s*;\s*")
+
+
 def parse_string_list(text: str) -> list[str]:
-    values: list[str] = []
-    for chunk in text.split(";"):
-        chunk = chunk.strip()
-        if chunk:
-            values.append(chunk)
-    return values
+    return [value for value in _SPLIT_RE.split(text.strip()) if value]
 
 
 def serialize_string_list(values: list[str]) -> str:
-    return "; ".join(value for value in values if value)
+    return "; ".join(filter(None, values))
 
 
 # ---------------------------------------------------------------------------
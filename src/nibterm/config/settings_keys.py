@@ -4,9 +4,13 @@ Using named constants instead of string literals prevents typos and
 makes bulk-renaming trivial.
 """
 
-# -- window ----------------------------------------------------------------
-WINDOW_GEOMETRY = "window/geometry"
-WINDOW_STATE = "window/state"
+# -- window / view (keys relative to their group) --------------------------
+WINDOW_GROUP = "window"
+WINDOW_GEOMETRY = "geometry"
+WINDOW_STATE = "state"
+VIEW_GROUP = "view"
+VIEW_TAB = "tab"
+VIEW_SPLITTER = "splitter"
 
 # -- serial ----------------------------------------------------------------
 SERIAL_PORT_NAME = "serial/port_name"
@@ -64,8 +68,9 @@ DASHBOARD_PLOT_COUNT = "dashboard/plot_count"
 DASHBOARD_PLOTS_PREFIX = "dashboard/plots/{}"  # format with index
 
 # -- variables (unified) ---------------------------------------------------
-VAR_COUNT = "variables/count"
-VAR_PREFIX = "variables/{}"  # format with index
+VAR_ARRAY = "variables"  # QSettings array (beginWriteArray / beginReadArray)
+VAR_COUNT = "variables/count"  # legacy layout, read-only
+VAR_PREFIX = "variables/{}"  # legacy layout, format with index
 SERIAL_PARSER_MODE = "serial_parser/mode"
 SERIAL_PARSER_CSV_DELIMITER = "serial_parser/csv_delimiter"
 SERIAL_PARSER_JSON_PREFIX = "serial_parser/json_prefix"
@@ -74,6 +79,9 @@ SERIAL_PARSER_JSON_PREFIX = "serial_parser/json_prefix"
 COMMANDS_LAST_PATH = "commands/last_path"
 COMMANDS_PARAMS_PREFIX = "commands/params/{preset}/{label}/{param}"
 
+# -- logging ---------------------------------------------------------------
+LOGGING_LAST_PATH = "logging/last_path"
+
 # -- console ---------------------------------------------------------------
 CONSOLE_MAX_BLOCK_COUNT = "console/max_block_count"
 
@@ -7,14 +7,30 @@ transform expression -- is represented as a single ``VariableDefinition``.
 from __future__ import annotations
 
 import json
+import sys
 from dataclasses import dataclass, field
-
-from PySide6.QtCore import QSettings
+from functools import lru_cache
+from typing import TYPE_CHECKING
 
 from . import settings_keys as SK
 
+if TYPE_CHECKING:
+    from PySide6.QtCore import QSettings
+
+try:
+    import orjson
+except ImportError:  # optional, stdlib json is used otherwise
+    _dumps = json.dumps
+    _loads = json.loads
+else:
+
+    def _dumps(obj: object) -> str:
+        return orjson.dumps(obj).decode("utf-8")
+
+    _loads = orjson.loads
 
-@dataclass
+
+@dataclass(slots=True)
 class TopicParserConfig:
     """Per-topic parser config for MQTT (same shape as SerialParserConfig)."""
 
@@ -22,7 +38,7 @@ class TopicParserConfig:
     csv_delimiter: str = ","
 
 
-@dataclass
+@dataclass(slots=True)
 class SerialParserConfig:
     """Global configuration for how serial data is parsed."""
 
@@ -44,7 +60,7 @@ class SerialParserConfig:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class VariableDefinition:
     """A single plottable variable, regardless of source."""
 
@@ -78,74 +94,124 @@ class VariableDefinition:
 
     def details_summary(self, serial_mode: str = "csv") -> str:
         """Human-readable summary of the extraction config."""
-        if self.source == "serial":
-            if serial_mode == "csv":
-                return f"CSV column {self.csv_column}"
-            if serial_mode == "json":
-                return self.json_path or "(no path)"
-            if serial_mode == "regex":
-                pat = self.regex_pattern or "(no pattern)"
-                return f"{pat} group {self.regex_group}"
-            return "?"
-        if self.source == "mqtt":
-            topic = self.mqtt_topic or "*"
-            path = self.json_path or "$"
-            return f"{topic} → {path}"
-        if self.source == "transform":
-            return self.expression or "(no expression)"
-        return ""
+        return _details_summary(*self.extraction_key(), serial_mode)
+
+
+@lru_cache(maxsize=256)
+def _details_summary(
+    source: str,
+    csv_column: int,
+    json_path: str,
+    regex_pattern: str,
+    regex_group: int,
+    mqtt_topic: str,
+    expression: str,
+    serial_mode: str,
+) -> str:
+    # Keyed on the field values rather than the instance: variables are
+    # edited in place, so a per-instance cache could go stale.
+    if source == "serial":
+        if serial_mode == "csv":
+            return f"CSV column {csv_column}"
+        if serial_mode == "json":
+            return json_path or "(no path)"
+        if serial_mode == "regex":
+            pat = regex_pattern or "(no pattern)"
+            return f"{pat} group {regex_group}"
+        return "?"
+    if source == "mqtt":
+        topic = mqtt_topic or "*"
+        path = json_path or "$"
+        return f"{topic} → {path}"
+    if source == "transform":
+        return expression or "(no expression)"
+    return ""
 
 
 def save_variables(variables: list[VariableDefinition], settings: QSettings) -> None:
     """Persist the variable list to QSettings."""
-    settings.setValue(SK.VAR_COUNT, len(variables))
+    # Clear the whole group first: drops entries beyond the new size as well
+    # as any keys left over from the legacy ``variables/count`` layout.
+    settings.remove(SK.VAR_ARRAY)
+    settings.beginWriteArray(SK.VAR_ARRAY, len(variables))
     for i, v in enumerate(variables):
-        prefix = SK.VAR_PREFIX.format(i)
-        settings.setValue(f"{prefix}/name", v.name)
-        settings.setValue(f"{prefix}/source", v.source)
-        settings.setValue(f"{prefix}/csv_column", v.csv_column)
-        settings.setValue(f"{prefix}/json_path", v.json_path)
-        settings.setValue(f"{prefix}/regex_pattern", v.regex_pattern)
-        settings.setValue(f"{prefix}/regex_group", v.regex_group)
-        settings.setValue(f"{prefix}/mqtt_topic", v.mqtt_topic)
-        settings.setValue(f"{prefix}/expression", v.expression)
-        settings.setValue(f"{prefix}/unit", v.unit)
+        settings.setArrayIndex(i)
+        settings.setValue("name", v.name)
+        settings.setValue("source", v.source)
+        settings.setValue("csv_column", v.csv_column)
+        settings.setValue("json_path", v.json_path)
+        settings.setValue("regex_pattern", v.regex_pattern)
+        settings.setValue("regex_group", v.regex_group)
+        settings.setValue("mqtt_topic", v.mqtt_topic)
+        settings.setValue("expression", v.expression)
+        settings.setValue("unit", v.unit)
+    settings.endArray()
 
 
 def load_variables(settings: QSettings) -> list[VariableDefinition]:
     """Restore the variable list from QSettings."""
+    if not settings.contains(f"{SK.VAR_ARRAY}/size"):
+        return _load_legacy_variables(settings)
+    variables: list[VariableDefinition] = []
+    count = settings.beginReadArray(SK.VAR_ARRAY)
+    for i in range(count):
+        settings.setArrayIndex(i)
+        var = _read_variable(settings)
+        if var is not None:
+            variables.append(var)
+    settings.endArray()
+    return variables
+
+
+def _load_legacy_variables(settings: QSettings) -> list[VariableDefinition]:
+    """Read variables stored as ``variables/count`` + ``variables/<i>/...``."""
     count = settings.value(SK.VAR_COUNT, 0, int)
+    if not count:
+        return []
+    # One key listing up front lets us skip unnamed slots without a lookup each.
+    all_keys = set(settings.allKeys())
     variables: list[VariableDefinition] = []
     for i in range(count):
         prefix = SK.VAR_PREFIX.format(i)
-        name = settings.value(f"{prefix}/name", "", str)
-        if not name:
+        if f"{prefix}/name" not in all_keys:
             continue
-        variables.append(
-            VariableDefinition(
-                name=name,
-                source=settings.value(f"{prefix}/source", "serial", str),
-                unit=settings.value(f"{prefix}/unit", "", str),
-                csv_column=settings.value(f"{prefix}/csv_column", 0, int),
-                json_path=settings.value(f"{prefix}/json_path", "", str),
-                regex_pattern=settings.value(f"{prefix}/regex_pattern", "", str),
-                regex_group=settings.value(f"{prefix}/regex_group", 1, int),
-                mqtt_topic=settings.value(f"{prefix}/mqtt_topic", "", str),
-                expression=settings.value(f"{prefix}/expression", "", str),
-            )
-        )
+        settings.beginGroup(prefix)
+        var = _read_variable(settings)
+        settings.endGroup()
+        if var is not None:
+            variables.append(var)
     return variables
 
 
+def _read_variable(settings: QSettings) -> VariableDefinition | None:
+    """Read one variable from the current group / array index."""
+    name = settings.value("name", "", str)
+    if not name:
+        return None
+    return VariableDefinition(
+        name=name,
+        source=sys.intern(settings.value("source", "serial", str)),
+        unit=settings.value("unit", "", str),
+        csv_column=settings.value("csv_column", 0, int),
+        json_path=settings.value("json_path", "", str),
+        regex_pattern=settings.value("regex_pattern", "", str),
+        regex_group=settings.value("regex_group", 1, int),
+        mqtt_topic=settings.value("mqtt_topic", "", str),
+        expression=settings.value("expression", "", str),
+    )
+
+
 def load_topic_parser_configs(settings: QSettings) -> dict[str, "TopicParserConfig"]:
     """Load per-topic parser configs from QSettings (JSON blob)."""
     raw = settings.value(SK.MQTT_TOPIC_PARSERS, "", str)
     if not raw:
         return {}
     try:
-        data = json.loads(raw)
+        data = _loads(raw)
     except (json.JSONDecodeError, TypeError):
         return {}
+    if not isinstance(data, dict):
+        return {}
     result: dict[str, TopicParserConfig] = {}
     for topic, cfg in data.items():
         if isinstance(cfg, dict):
@@ -164,4 +230,4 @@ def save_topic_parser_configs(
         topic: {"mode": c.mode, "csv_delimiter": c.csv_delimiter}
         for topic, c in configs.items()
     }
-    settings.setValue(SK.MQTT_TOPIC_PARSERS, json.dumps(data))
+    settings.setValue(SK.MQTT_TOPIC_PARSERS, _dumps(data))
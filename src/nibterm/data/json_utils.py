@@ -5,11 +5,33 @@ used by the MQTT monitor to parse JSON payloads and name variables.
 """
 from __future__ import annotations
 
+import io
 import json
 import re
+from functools import lru_cache
 
 from jsonpath_ng import parse as jsonpath_parse
 from jsonpath_ng.exceptions import JsonPathParserError
+from jsonpath_ng.lexer import JsonPathLexer
+
+# Strings are rendered with json.dumps' default ensure_ascii: the ranges
+# are counted in code points, while the Qt displays count UTF-16 units, so
+# the text must not contain characters outside the BMP.
+_quote = json.dumps
+
+# Plain ``$.a.b[0].c`` paths are walked directly; anything else (wildcards,
+# filters, quoted keys, ...) goes through jsonpath_ng.
+_SIMPLE_PATH_RE = re.compile(r"\$(?:\.[A-Za-z_][A-Za-z0-9_]*|\[\d+\])*")
+_PATH_STEP_RE = re.compile(r"\.([A-Za-z_][A-Za-z0-9_]*)|\[(\d+)\]")
+
+_INDEX_RE = re.compile(r"\[\s*(\d+)\s*\]")
+_SANITIZE_RE = re.compile(r"[^a-zA-Z0-9_]")
+# Byte table equivalent of _SANITIZE_RE for ASCII names.  bytes.translate
+# is several times faster than both the regex and str.translate here.
+_SANITIZE_TABLE = bytes(
+    c if chr(c).isascii() and (chr(c).isalnum() or c == ord("_")) else ord("_")
+    for c in range(256)
+)
 
 
 def build_json_with_path_ranges(
@@ -17,10 +39,8 @@ def build_json_with_path_ranges(
 ) -> tuple[str, list[tuple[int, int, str, str]]]:
     """Build pretty-printed JSON and a list of ``(start, end, json_path, key_name)`` for each primitive value."""
     positions: list[tuple[int, int, str, str]] = []
-    chunks: list[str] = []
-
-    def tell() -> int:
-        return sum(len(c) for c in chunks)
+    buf = io.StringIO()
+    push = buf.write
 
     def _key_from_path(p: str) -> str:
         if p == "$":
@@ -30,22 +50,22 @@ def build_json_with_path_ranges(
         else:
             rest = p.lstrip("$.")
         # e.g. "sensors[0]" -> "sensors_0", "value" -> "value"
-        rest = re.sub(r"\[\s*(\d+)\s*\]", r"_\1", rest)
+        rest = _INDEX_RE.sub(r"_\1", rest)
         return rest or "value"
 
     def emit(obj: object, path: str, key_name: str) -> None:
-        start = tell()
+        start = buf.tell()
         if obj is None:
-            chunks.append("null")
+            push("null")
         elif isinstance(obj, bool):
-            chunks.append("true" if obj else "false")
+            push("true" if obj else "false")
         elif isinstance(obj, (int, float)):
-            chunks.append(json.dumps(obj))
+            push(json.dumps(obj))
         elif isinstance(obj, str):
-            chunks.append(json.dumps(obj))
+            push(_quote(obj))
         else:
             return
-        end = tell()
+        end = buf.tell()
         positions.append((start, end, path, key_name or _key_from_path(path)))
 
     def walk(obj: object, path: str, indent_level: int) -> None:
@@ -54,68 +74,121 @@ def build_json_with_path_ranges(
             emit(obj, path, key_name)
             return
         if isinstance(obj, dict):
-            chunks.append("{\n")
+            push("{\n")
             for i, (k, v) in enumerate(obj.items()):
                 sub_path = f"{path}.{k}" if path != "$" else f"$.{k}"
-                chunks.append(" " * (indent_level + 2))
-                chunks.append(json.dumps(k) + ": ")
+                push(" " * (indent_level + 2))
+                push(_quote_key(k))
                 walk(v, sub_path, indent_level + 2)
                 if i < len(obj) - 1:
-                    chunks.append(",")
-                chunks.append("\n")
-            chunks.append(" " * indent_level + "}")
+                    push(",")
+                push("\n")
+            push(" " * indent_level + "}")
             return
         if isinstance(obj, list):
-            chunks.append("[\n")
+            push("[\n")
             for i, v in enumerate(obj):
                 sub_path = f"{path}[{i}]"
-                chunks.append(" " * (indent_level + 2))
+                push(" " * (indent_level + 2))
                 walk(v, sub_path, indent_level + 2)
                 if i < len(obj) - 1:
-                    chunks.append(",")
-                chunks.append("\n")
-            chunks.append(" " * indent_level + "]")
+                    push(",")
+                push("\n")
+            push(" " * indent_level + "]")
             return
 
     walk(obj, path, indent)
-    return "".join(chunks), positions
+    return buf.getvalue(), positions
+
+
+@lru_cache(maxsize=1024)
+def _quote_key(key: str) -> str:
+    """Return ``"key": `` as rendered in the tree; keys repeat across messages."""
+    if key.isascii() and key.isprintable() and '"' not in key and "\\" not in key:
+        return f'"{key}": '
+    return _quote(key) + ": "
 
 
 def extract_json_value(data: object, path_str: str) -> float | None:
     """Use a JSONPath expression to pull a numeric value out of *data*."""
-    try:
-        path = jsonpath_parse(path_str)
+    path = _compile_json_path(path_str)
+    if path is None:
+        return None
+    if isinstance(path, tuple):
+        val = _walk_json_path(data, path)
+    else:
         matches = path.find(data)
         if not matches:
             return None
         val = matches[0].value
-        if isinstance(val, (int, float)):
+    if isinstance(val, (int, float)):
+        return float(val)
+    if isinstance(val, str):
+        try:
             return float(val)
-        if isinstance(val, str):
-            try:
-                return float(val)
-            except ValueError:
-                return None
-        return None
+        except ValueError:
+            return None
+    return None
+
+
+@lru_cache(maxsize=512)
+def _compile_json_path(path_str: str):
+    """Return the steps of a simple path, a parsed JSONPath, or None if invalid."""
+    if _SIMPLE_PATH_RE.fullmatch(path_str):
+        steps = tuple(
+            key or int(index) for key, index in _PATH_STEP_RE.findall(path_str)
+        )
+        if not any(step in JsonPathLexer.reserved_words for step in steps):
+            return steps
+    try:
+        return jsonpath_parse(path_str)
     except JsonPathParserError:
         return None
 
 
+def _walk_json_path(data: object, steps: tuple[str | int, ...]) -> object:
+    """Follow *steps* like jsonpath_ng would: keys into dicts, indices into sequences."""
+    for step in steps:
+        if isinstance(step, str):
+            if not isinstance(data, dict):
+                return None
+            data = data.get(step)
+        else:
+            if not isinstance(data, (list, str)) or step >= len(data):
+                return None
+            data = data[step]
+    return data
+
+
 def sanitize_var_name(name: str) -> str:
     """Make a string safe for use as a variable / column name."""
     if not name:
         return "value"
-    s = re.sub(r"[^a-zA-Z0-9_]", "_", name)
+    if name.isascii():
+        s = name.encode("ascii").translate(_SANITIZE_TABLE).decode("ascii")
+    else:
+        s = _SANITIZE_RE.sub("_", name)
     return s.strip("_") or "value"
 
 
-def unique_variable_name(base: str, existing: set[str]) -> str:
-    """Return *base* or ``base_2``, ``base_3``, … so the result is not in *existing*."""
+def unique_variable_name(
+    base: str,
+    existing: set[str],
+    next_suffix: dict[str, int] | None = None,
+) -> str:
+    """Return *base* or ``base_2``, ``base_3``, … so the result is not in *existing*.
+
+    When naming many variables against a growing *existing* set, pass the
+    same *next_suffix* dict to every call so repeated bases resume probing
+    where the previous call stopped instead of starting again at ``_2``.
+    """
     if not base:
         base = "value"
     if base not in existing:
         return base
-    n = 2
+    n = next_suffix.get(base, 2) if next_suffix is not None else 2
     while f"{base}_{n}" in existing:
         n += 1
+    if next_suffix is not None:
+        next_suffix[base] = n + 1
     return f"{base}_{n}"
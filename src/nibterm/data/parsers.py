@@ -7,6 +7,29 @@ from __future__ import annotations
 
 import json
 import re
+from collections.abc import Iterable
+from functools import lru_cache
+
+try:
+    import orjson
+except ImportError:  # optional, stdlib json is used otherwise
+    _loads = json.loads
+else:
+
+    def _loads(payload: str) -> object:
+        try:
+            return orjson.loads(payload)
+        except orjson.JSONDecodeError:
+            # NaN/Infinity literals and oversized ints are stdlib-only
+            return json.loads(payload)
+
+try:
+    import re2
+except ImportError:  # optional, linear-time engine for user patterns
+    re2 = None
+
+# First characters of anything float() accepts: digits, sign, '.', inf, nan
+_FLOAT_START = frozenset("+-.0123456789iInN")
 
 
 def parse_csv_line(
@@ -18,16 +41,30 @@ def parse_csv_line(
 
     If column_indices is None, use all indices 0..len(parts)-1 that
     parse as float. Only successful float conversions are included.
+    When column_indices is given, the line is only split as far as the
+    highest requested column.
     """
-    parts = [p.strip() for p in line.split(delimiter)]
+    if column_indices is None:
+        parts = line.split(delimiter)
+        indices: Iterable[int] = range(len(parts))
+    else:
+        max_idx = max(column_indices, default=-1)
+        if max_idx < 0:
+            return {}
+        parts = line.split(delimiter, max_idx + 1)
+        indices = column_indices
     result: dict[int, float] = {}
-    indices = column_indices if column_indices is not None else range(len(parts))
+    count = len(parts)
     for i in indices:
-        if i < 0 or i >= len(parts):
+        if i < 0 or i >= count:
+            continue
+        part = parts[i].strip()
+        # Skip obvious non-numbers without paying for a raised ValueError
+        if not part or part[0] not in _FLOAT_START:
             continue
         try:
-            result[i] = float(parts[i])
-        except (ValueError, TypeError):
+            result[i] = float(part)
+        except ValueError:
             pass
     return result
 
@@ -35,17 +72,17 @@ def parse_csv_line(
 def parse_json_payload(payload: str) -> object | None:
     """Parse a JSON payload string. Returns None on error."""
     try:
-        return json.loads(payload)
+        return _loads(payload)
     except (json.JSONDecodeError, TypeError, ValueError):
         return None
 
 
 def parse_regex_value(line: str, pattern: str, group: int) -> float | None:
     """Extract one capture group from line and return as float, or None."""
-    try:
-        m = re.search(pattern, line)
-    except re.error:
+    regex = _compile_regex(pattern)
+    if regex is None:
         return None
+    m = regex.search(line)
     if m is None:
         return None
     try:
@@ -53,3 +90,22 @@ def parse_regex_value(line: str, pattern: str, group: int) -> float | None:
         return float(raw)
     except (IndexError, ValueError, TypeError):
         return None
+
+
+@lru_cache(maxsize=256)
+def _compile_regex(pattern: str):
+    """Compile a user-supplied pattern once; None if it is invalid.
+
+    Uses google-re2 when installed, so a pathological pattern cannot stall
+    the serial path with catastrophic backtracking. Patterns re2 does not
+    support (backreferences, lookaround) fall back to ``re``.
+    """
+    if re2 is not None:
+        try:
+            return re2.compile(pattern)
+        except re2.error:
+            pass
+    try:
+        return re.compile(pattern)
+    except re.error:
+        return None
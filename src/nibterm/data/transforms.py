@@ -8,6 +8,10 @@ from __future__ import annotations
 
 import ast
 import math
+from collections.abc import Callable
+from dataclasses import dataclass
+from functools import lru_cache
+from types import CodeType
 
 # Functions allowed inside user-defined expressions
 ALLOWED_FUNCS: dict[str, object] = {
@@ -26,16 +30,79 @@ ALLOWED_FUNCS: dict[str, object] = {
 # Names in expressions that are not variable references
 _RESERVED = frozenset(ALLOWED_FUNCS) | {"pi", "e"}
 
+# Globals for evaluated expressions.  Shared by every compiled expression,
+# never mutated.
+_BASE_SCOPE: dict[str, object] = {
+    "__builtins__": {},
+    **ALLOWED_FUNCS,
+    "pi": math.pi,
+    "e": math.e,
+}
+
 
 def safe_eval(expr: str, variables: dict[str, float]) -> float:
-    """Evaluate a mathematical expression in a restricted scope."""
+    """Evaluate a mathematical expression in a restricted scope.
+
+    *variables* is only read; just the names the expression uses are looked up.
+    """
+    compiled = _compile_expr(expr)
+    if not any(n in variables for n in compiled.shadowed):
+        try:
+            args = [variables[n] for n in compiled.params]
+        except KeyError as exc:
+            raise NameError(f"name {exc.args[0]!r} is not defined") from None
+        return compiled.func(*args)
+    # A variable shadows a function or constant: evaluate with a full scope.
+    scope = _BASE_SCOPE.copy()
+    scope.update({n: variables[n] for n in compiled.names if n in variables})
+    return eval(compiled.code, scope, {})  # noqa: S307
+
+
+@dataclass(slots=True, frozen=True)
+class _CompiledExpr:
+    code: CodeType
+    func: Callable[..., float]
+    params: tuple[str, ...]  # variable references, in argument order
+    shadowed: tuple[str, ...]  # referenced function / constant names
+
+    @property
+    def names(self) -> tuple[str, ...]:
+        return self.params + self.shadowed
+
+
+@lru_cache(maxsize=256)
+def _compile_expr(expr: str) -> _CompiledExpr:
+    """Parse, validate and compile *expr* once.
+
+    Besides the code object, the expression is compiled into a function
+    taking its variables as positional arguments, so evaluating it does not
+    need a scope dict per call.
+    """
     tree = ast.parse(expr, mode="eval")
     _validate_ast(tree)
-    scope: dict[str, object] = {"__builtins__": {}}
-    scope.update(ALLOWED_FUNCS)
-    scope.update({"pi": math.pi, "e": math.e})
-    scope.update(variables)
-    return eval(compile(tree, "<expr>", "eval"), scope, {})  # noqa: S307
+    names = {node.id for node in ast.walk(tree) if isinstance(node, ast.Name)}
+    params = tuple(sorted(names - _RESERVED))
+    shadowed = tuple(sorted(names & _RESERVED))
+    wrapper = ast.Expression(
+        body=ast.Lambda(
+            args=ast.arguments(
+                posonlyargs=[],
+                args=[ast.arg(arg=n) for n in params],
+                kwonlyargs=[],
+                kw_defaults=[],
+                defaults=[],
+            ),
+            body=tree.body,
+        )
+    )
+    ast.fix_missing_locations(wrapper)
+    func = eval(compile(wrapper, "<expr>", "eval"), _BASE_SCOPE)  # noqa: S307
+    return _CompiledExpr(
+        code=compile(tree, "<expr>", "eval"),
+        func=func,
+        params=params,
+        shadowed=shadowed,
+    )
 
 
 def _validate_ast(tree: ast.AST) -> None:
@@ -66,17 +133,31 @@ def _validate_ast(tree: ast.AST) -> None:
 
 def get_expression_variable_names(expr: str) -> set[str]:
     """Return the set of variable names referenced in an expression (not functions/constants)."""
+    return set(_expression_variable_names(expr))
+
+
+@lru_cache(maxsize=256)
+def _expression_variable_names(expr: str) -> frozenset[str]:
     if not (expr or expr.strip()):
-        return set()
+        return frozenset()
     try:
         tree = ast.parse(expr.strip(), mode="eval")
     except SyntaxError:
-        return set()
-    names: set[str] = set()
-    for node in ast.walk(tree):
-        if isinstance(node, ast.Name) and node.id not in _RESERVED:
-            names.add(node.id)
-    return names
+        return frozenset()
+    collector = _NameCollector()
+    collector.visit(tree)
+    return frozenset(collector.names)
+
+
+class _NameCollector(ast.NodeVisitor):
+    """Collect every ``Name`` that is not a function or constant."""
+
+    def __init__(self) -> None:
+        self.names: set[str] = set()
+
+    def visit_Name(self, node: ast.Name) -> None:
+        if node.id not in _RESERVED:
+            self.names.add(node.id)
 
 
 def rewrite_expression_rename(expr: str, old_name: str, new_name: str) -> str:
@@ -6,9 +6,11 @@ that previously lived in ``MainWindow`` and ``MQTTMonitorWidget``.
 from __future__ import annotations
 
 import logging
+from collections.abc import Callable
 from dataclasses import replace
+from graphlib import CycleError, TopologicalSorter
 
-from PySide6.QtCore import QObject, QSettings, Signal
+from PySide6.QtCore import QObject, QSettings, QTimer, Signal
 
 from ..config.variable import (
     SerialParserConfig,
@@ -29,6 +31,8 @@ from .transforms import (
 
 logger = logging.getLogger(__name__)
 
+_SAVE_DELAY_MS = 500
+
 
 class VariableManager(QObject):
     """Central store and processor for all defined variables.
@@ -55,14 +59,61 @@ class VariableManager(QObject):
         )
         self._values: dict[str, float] = {}
         self._last_serial_line: str = ""  # for Serial Plot variables panel (last line display and click-to-add CSV columns)
+        # Lookup indexes over self._variables, rebuilt by _reindex() on every edit
+        self._by_source: dict[str, list[VariableDefinition]] = {}
+        self._by_name: dict[str, VariableDefinition] = {}
+        self._transform_deps: dict[str, set[str]] = {}  # name -> transforms referencing it
+        self._transform_order: list[VariableDefinition] = []  # inputs before dependents
+        self._transform_roots: set[str] = set()  # transforms without variable inputs
+        # line -> {name: value} for the current serial variables and parser
+        # config, rebuilt by _build_serial_parser() when either changes
+        self._serial_parser: Callable[[str], dict[str, float]] | None = None
+        self._reindex()
+        # Edits are persisted shortly after the last one, not once per edit
+        self._save_timer = QTimer(self)
+        self._save_timer.setSingleShot(True)
+        self._save_timer.setInterval(_SAVE_DELAY_MS)
+        self._save_timer.timeout.connect(self.save)
+
+    def _reindex(self) -> None:
+        by_source: dict[str, list[VariableDefinition]] = {}
+        by_name: dict[str, VariableDefinition] = {}
+        deps: dict[str, set[str]] = {}
+        graph: dict[str, set[str]] = {}
+        for v in self._variables:
+            by_source.setdefault(v.source, []).append(v)
+            by_name[v.name] = v
+            if v.source == "transform" and v.expression:
+                refs = get_expression_variable_names(v.expression)
+                graph[v.name] = refs
+                for ref in refs:
+                    deps.setdefault(ref, set()).add(v.name)
+        transforms = [v for v in by_source.get("transform", ()) if v.expression]
+        try:
+            order = list(TopologicalSorter(graph).static_order())
+            rank = {name: i for i, name in enumerate(order)}
+            transforms.sort(key=lambda v: rank[v.name])
+        except CycleError:
+            pass  # keep list order; cyclic transforms just see stale inputs
+        self._by_source = by_source
+        self._by_name = by_name
+        self._transform_deps = deps
+        self._transform_order = transforms
+        self._transform_roots = {name for name, refs in graph.items() if not refs}
+        self._serial_parser = self._build_serial_parser()
 
     # -- persistence ----------------------------------------------------------
 
     def save(self) -> None:
+        """Persist now, including any edit still waiting for the save timer."""
+        self._save_timer.stop()
         save_variables(self._variables, self._settings)
         self._serial_config.to_qsettings(self._settings)
         save_topic_parser_configs(self._topic_parser_configs, self._settings)
 
+    def _schedule_save(self) -> None:
+        self._save_timer.start()  # restarts if already pending
+
     # -- accessors ------------------------------------------------------------
 
     @property
@@ -96,98 +147,78 @@ class VariableManager(QObject):
 
     def get_mqtt_variables(self) -> list[VariableDefinition]:
         """Return only the MQTT-sourced variables."""
-        return [v for v in self._variables if v.source == "mqtt"]
+        return list(self._by_source.get("mqtt", ()))
 
     def get_serial_variables(self) -> list[VariableDefinition]:
         """Return only the serial-sourced variables."""
-        return [v for v in self._variables if v.source == "serial"]
+        return list(self._by_source.get("serial", ()))
+
+    def has_serial_variables(self) -> bool:
+        """Return True if any variable is parsed from serial lines."""
+        return "serial" in self._by_source
 
     # -- CRUD -----------------------------------------------------------------
 
     def add_variable(self, var: VariableDefinition) -> None:
-        existing = {v.name for v in self._variables}
-        var.name = unique_variable_name(var.name or "var", existing)
+        var.name = unique_variable_name(var.name or "var", set(self._by_name))
         self._variables.append(var)
-        self.save()
+        self._reindex()
+        self._schedule_save()
         self.variables_changed.emit()
 
     def remove_variable(self, name: str) -> None:
         # Remove this variable and any transforms that depend on it (recursively)
-        to_remove: set[str] = {name}
-        while True:
-            dependents = self._transforms_depending_on(to_remove)
-            if dependents <= to_remove:
-                break
-            to_remove |= dependents
-        for n in to_remove:
-            self._values.pop(n, None)
-        self._variables = [v for v in self._variables if v.name not in to_remove]
-        self.save()
-        self.variables_changed.emit()
+        self._remove_with_dependents({name})
 
     def _transforms_depending_on(self, names: set[str]) -> set[str]:
-        """Return names of transform variables whose expression references any of the given names."""
+        """Return names of transforms that reference any of *names*, directly or transitively."""
         dependents: set[str] = set()
-        for v in self._variables:
-            if v.source == "transform" and v.expression:
-                refs = get_expression_variable_names(v.expression)
-                if refs & names:
-                    dependents.add(v.name)
+        pending = list(names)
+        while pending:
+            for dep in self._transform_deps.get(pending.pop(), ()):
+                if dep not in dependents:
+                    dependents.add(dep)
+                    pending.append(dep)
         return dependents
 
-    def remove_all_mqtt_variables(self) -> None:
-        """Remove all MQTT-sourced variables and any transforms that depend on them."""
-        removed = {v.name for v in self._variables if v.source == "mqtt"}
-        while True:
-            dependents = self._transforms_depending_on(removed)
-            if dependents <= removed:
-                break
-            removed |= dependents
+    def _remove_with_dependents(self, names: set[str]) -> None:
+        removed = names | self._transforms_depending_on(names)
         self._variables = [v for v in self._variables if v.name not in removed]
-        for name in removed:
-            self._values.pop(name, None)
-        self.save()
+        for n in removed:
+            self._values.pop(n, None)
+        self._reindex()
+        self._schedule_save()
         self.variables_changed.emit()
 
+    def remove_all_mqtt_variables(self) -> None:
+        """Remove all MQTT-sourced variables and any transforms that depend on them."""
+        self._remove_with_dependents({v.name for v in self._by_source.get("mqtt", ())})
+
     def remove_all_serial_variables(self) -> None:
         """Remove all serial-sourced variables and any transforms that depend on them."""
-        removed = {v.name for v in self._variables if v.source == "serial"}
-        while True:
-            dependents = self._transforms_depending_on(removed)
-            if dependents <= removed:
-                break
-            removed |= dependents
-        self._variables = [v for v in self._variables if v.name not in removed]
-        for name in removed:
-            self._values.pop(name, None)
-        self.save()
-        self.variables_changed.emit()
+        self._remove_with_dependents({v.name for v in self._by_source.get("serial", ())})
 
     def update_variable(self, old_name: str, new_var: VariableDefinition) -> None:
-        existing = {v.name for v in self._variables if v.name != old_name}
+        existing = self._by_name.keys() - {old_name}
         if new_var.name in existing:
             new_var = replace(
                 new_var,
                 name=unique_variable_name(new_var.name, existing),
             )
-        for i, v in enumerate(self._variables):
-            if v.name == old_name:
-                if new_var.name != old_name:
-                    val = self._values.pop(old_name, None)
-                    if val is not None:
-                        self._values[new_var.name] = val
-                    # Update transform expressions that reference the old name
-                    for idx_t, t in enumerate(self._variables):
-                        if t.source == "transform" and t.expression:
-                            refs = get_expression_variable_names(t.expression)
-                            if old_name in refs:
-                                new_expr = rewrite_expression_rename(
-                                    t.expression, old_name, new_var.name
-                                )
-                                self._variables[idx_t] = replace(t, expression=new_expr)
-                self._variables[i] = new_var
-                break
-        self.save()
+        old_var = self._by_name.get(old_name)
+        if old_var is not None:
+            if new_var.name != old_name:
+                val = self._values.pop(old_name, None)
+                if val is not None:
+                    self._values[new_var.name] = val
+                # Update transform expressions that reference the old name
+                for t_name in self._transform_deps.get(old_name, ()):
+                    t = self._by_name[t_name]
+                    new_expr = rewrite_expression_rename(t.expression, old_name, new_var.name)
+                    self._variables[self._variables.index(t)] = replace(t, expression=new_expr)
+            self._variables[self._variables.index(old_var)] = new_var
+            self._reindex()
+        self._schedule_save()
         self.variables_changed.emit()
 
     def set_variables(self, variables: list[VariableDefinition]) -> None:
@@ -197,9 +228,10 @@ class VariableManager(QObject):
         """
         # Enforce unique names
         used: set[str] = set()
+        next_suffix: dict[str, int] = {}
         unique_list: list[VariableDefinition] = []
         for v in variables:
-            name = unique_variable_name(v.name or "var", used)
+            name = unique_variable_name(v.name or "var", used, next_suffix)
             used.add(name)
             unique_list.append(replace(v, name=name))
 
@@ -227,14 +259,15 @@ class VariableManager(QObject):
                     self._values[new_var.name] = val
 
         self._variables = unique_list
-        valid_names = {v.name for v in self._variables}
-        self._values = {k: v for k, v in self._values.items() if k in valid_names}
-        self.save()
+        self._reindex()
+        self._values = {k: v for k, v in self._values.items() if k in self._by_name}
+        self._schedule_save()
         self.variables_changed.emit()
 
     def set_serial_config(self, config: SerialParserConfig) -> None:
         self._serial_config = config
-        self.save()
+        self._serial_parser = self._build_serial_parser()
+        self._schedule_save()
 
     def get_topic_parser_config(self, topic: str) -> TopicParserConfig:
         """Return parser config for topic; default JSON if not set."""
@@ -244,7 +277,7 @@ class VariableManager(QObject):
 
     def set_topic_parser_config(self, topic: str, config: TopicParserConfig) -> None:
         self._topic_parser_configs[topic] = config
-        self.save()
+        self._schedule_save()
 
     def get_last_serial_line(self) -> str:
         """Last line received from serial (for Serial Plot variables panel)."""
@@ -264,25 +297,37 @@ class VariableManager(QObject):
         contains only the variable names that were freshly parsed from
         this line.
         """
-        self._last_serial_line = line
-        updated: set[str] = set()
-        serial_vars = [v for v in self._variables if v.source == "serial"]
-        if not serial_vars:
-            return self.get_values(), updated
+        return self.process_serial_batch([line])[0]
 
-        mode = self._serial_config.mode
+    def process_serial_batch(
+        self, lines: list[str]
+    ) -> list[tuple[dict[str, float], set[str]]]:
+        """Parse several lines in order, emitting ``values_updated`` once.
 
-        if mode == "csv":
-            self._parse_csv(line, serial_vars, updated)
-        elif mode == "json":
-            self._parse_serial_json(line, serial_vars, updated)
-        elif mode == "regex":
-            self._parse_serial_regex(line, serial_vars, updated)
-
-        # Evaluate transforms
-        self._evaluate_transforms(updated)
+        Returns one ``(all_values, updated_names)`` pair per line, as
+        :meth:`process_serial_line` would.
+        """
+        if not lines:
+            return []
+        self._last_serial_line = lines[-1]
+        serial_vars = self._by_source.get("serial")
+        if not serial_vars:
+            values = self.get_values()
+            return [(values, set()) for _ in lines]
+
+        parse = self._serial_parser
+        results: list[tuple[dict[str, float], set[str]]] = []
+        for line in lines:
+            updated: set[str] = set()
+            if parse is not None:
+                parsed = parse(line)
+                self._values.update(parsed)
+                updated.update(parsed)
+            # Evaluate transforms
+            self._evaluate_transforms(updated)
+            results.append((self.get_values(), updated))
         self.values_updated.emit()
-        return self.get_values(), updated
+        return results
 
     def process_mqtt_values(self, values_by_name: dict[str, float]) -> tuple[dict[str, float], set[str]]:
         """Merge MQTT-extracted values and evaluate transforms.
@@ -300,70 +345,96 @@ class VariableManager(QObject):
 
     # -- internal parsers (use shared parsers module) -------------------------
 
-    def _parse_csv(
-        self,
-        line: str,
-        serial_vars: list[VariableDefinition],
-        updated: set[str],
-    ) -> None:
-        delim = self._serial_config.csv_delimiter
-        column_values = parse_csv_line(line, delim, column_indices=None)
-        for v in serial_vars:
-            if v.csv_column not in column_values:
-                continue
-            self._values[v.name] = column_values[v.csv_column]
-            updated.add(v.name)
-
-    def _parse_serial_json(
-        self,
-        line: str,
-        serial_vars: list[VariableDefinition],
-        updated: set[str],
-    ) -> None:
-        text = line.strip()
-        prefix = (self._serial_config.json_prefix or "").strip()
-        if prefix and text.startswith(prefix):
-            text = text[len(prefix) :].strip()
-        obj = parse_json_payload(text)
-        if obj is None:
-            return
-        for v in serial_vars:
-            if not v.json_path:
-                continue
-            val = extract_json_value(obj, v.json_path)
-            if val is not None:
-                self._values[v.name] = val
-                updated.add(v.name)
+    def _build_serial_parser(self) -> Callable[[str], dict[str, float]] | None:
+        """Return a line parser specialised for the current serial variables.
 
-    def _parse_serial_regex(
-        self,
-        line: str,
-        serial_vars: list[VariableDefinition],
-        updated: set[str],
-    ) -> None:
-        for v in serial_vars:
-            if not v.regex_pattern:
-                continue
-            val = parse_regex_value(line, v.regex_pattern, v.regex_group)
-            if val is not None:
-                self._values[v.name] = val
-                updated.add(v.name)
+        Everything that only depends on the variable list and parser config
+        (mode, delimiter, columns, paths, patterns) is resolved here once,
+        so parsing a line does no per-variable attribute lookups or mode
+        checks.
+        """
+        serial_vars = self._by_source.get("serial")
+        if not serial_vars:
+            return None
+        config = self._serial_config
+
+        if config.mode == "csv":
+            delim = config.csv_delimiter
+            columns = [(v.name, v.csv_column) for v in serial_vars]
+            indices = [col for _, col in columns]
+
+            def parse_csv(line: str) -> dict[str, float]:
+                column_values = parse_csv_line(line, delim, column_indices=indices)
+                return {
+                    name: column_values[col]
+                    for name, col in columns
+                    if col in column_values
+                }
+
+            return parse_csv
+
+        if config.mode == "json":
+            prefix = (config.json_prefix or "").strip()
+            paths = [(v.name, v.json_path) for v in serial_vars if v.json_path]
+
+            def parse_json(line: str) -> dict[str, float]:
+                text = line.strip()
+                if prefix and text.startswith(prefix):
+                    text = text[len(prefix) :].strip()
+                obj = parse_json_payload(text)
+                if obj is None:
+                    return {}
+                result: dict[str, float] = {}
+                for name, path in paths:
+                    val = extract_json_value(obj, path)
+                    if val is not None:
+                        result[name] = val
+                return result
+
+            return parse_json
+
+        if config.mode == "regex":
+            patterns = [
+                (v.name, v.regex_pattern, v.regex_group)
+                for v in serial_vars
+                if v.regex_pattern
+            ]
+
+            def parse_regex(line: str) -> dict[str, float]:
+                result: dict[str, float] = {}
+                for name, pattern, group in patterns:
+                    val = parse_regex_value(line, pattern, group)
+                    if val is not None:
+                        result[name] = val
+                return result
+
+            return parse_regex
+
+        return None
 
     def _evaluate_transforms(self, updated: set[str]) -> None:
-        """Evaluate all transform variables using current values snapshot.
+        """Re-evaluate the transforms affected by *updated*, adding them to it.
 
-        Uses the latest value for each variable regardless of source (Serial, MQTT).
-        Transforms are recomputed whenever any variable value changes, so mixed
-        Serial/MQTT formulas always use the most recent value of each input.
+        Only transforms that reference an updated variable (directly or via
+        another transform) are recomputed, in dependency order. Each uses the
+        latest value of every input regardless of source (Serial, MQTT), so
+        mixed Serial/MQTT formulas always see the most recent values.
+        Transforms without variable inputs are evaluated on every update.
         """
-        transform_vars = [v for v in self._variables if v.source == "transform"]
-        for v in transform_vars:
-            if not v.expression:
+        deps = self._transform_deps
+        dirty = set(self._transform_roots)
+        for name in updated:
+            dirty.update(deps.get(name, ()))
+        if not dirty:
+            return
+        for v in self._transform_order:
+            if v.name not in dirty:
                 continue
             try:
-                result = safe_eval(v.expression, dict(self._values))
+                result = safe_eval(v.expression, self._values)
                 numeric = float(result)
                 self._values[v.name] = numeric
                 updated.add(v.name)
+                dirty.update(deps.get(v.name, ()))
             except Exception:
                 pass
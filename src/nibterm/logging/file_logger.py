@@ -1,31 +1,75 @@
 from __future__ import annotations
 
+import logging
+import os
+import queue
+import threading
 from pathlib import Path
 
+logger = logging.getLogger(__name__)
+
+# Pending writes before log_line() starts blocking on a stalled disk
+_QUEUE_SIZE = 8192
+
+# O_BINARY (Windows only) keeps the CRT from turning the os.linesep we
+# write into "\r\r\n".
+_BINARY = getattr(os, "O_BINARY", 0)
+_OPEN_FLAGS = {
+    "a": os.O_WRONLY | os.O_CREAT | os.O_APPEND | _BINARY,
+    "w": os.O_WRONLY | os.O_CREAT | os.O_TRUNC | _BINARY,
+}
+
 
 class FileLogger:
+    """Append lines to a log file from a background writer thread.
+
+    ``log_line`` only queues text, so a slow disk never stalls the caller.
+    """
+
     def __init__(self) -> None:
-        self._file = None
+        self._fd: int | None = None
         self._path: Path | None = None
+        self._queue: queue.Queue[str | None] = queue.Queue(maxsize=_QUEUE_SIZE)
+        self._thread: threading.Thread | None = None
 
     def start(self, path: str | Path, mode: str = "a") -> None:
         self.stop()
         self._path = Path(path)
-        self._file = self._path.open(mode, encoding="utf-8")
+        self._fd = os.open(self._path, _OPEN_FLAGS[mode], 0o644)
+        self._thread = threading.Thread(
+            target=_write_loop,
+            args=(self._fd, self._queue),
+            name="FileLogger",
+            daemon=True,
+        )
+        self._thread.start()
 
     def stop(self) -> None:
-        if self._file:
-            self._file.close()
-        self._file = None
+        if self._thread:
+            self._queue.put(None)
+            self._thread.join()
+            self._thread = None
+        if self._fd is not None:
+            os.close(self._fd)
+        self._fd = None
 
     def is_active(self) -> bool:
-        return self._file is not None
+        return self._fd is not None
 
     def log_line(self, line: str) -> None:
-        if not self._file:
+        if self._fd is None:
             return
-        self._file.write(f"{line}\n")
-        self._file.flush()
+        self._queue.put(f"{line}{os.linesep}")
+
+    def log_lines(self, lines: list[str]) -> None:
+        if self._fd is None or not lines:
+            return
+        self._queue.put(os.linesep.join(lines) + os.linesep)
+
+    def flush(self) -> None:
+        """Block until every queued line has been written."""
+        if self._thread:
+            self._queue.join()
 
     def path(self) -> Path | None:
         return self._path
@@ -34,3 +78,31 @@ class FileLogger:
         if not self._path or not self._path.exists():
             return 0
         return self._path.stat().st_size
+
+
+def _write_loop(fd: int, q: queue.Queue[str | None]) -> None:
+    """Drain *q* into *fd*, coalescing queued items into one write, until None."""
+    failed = False
+    while True:
+        items = [q.get()]
+        while True:
+            try:
+                items.append(q.get_nowait())
+            except queue.Empty:
+                break
+        done = None in items
+        try:
+            if not failed:
+                text = "".join(item for item in items if item is not None)
+                view = memoryview(text.encode("utf-8", errors="replace"))
+                while view:
+                    view = view[os.write(fd, view) :]
+        except Exception:
+            # Keep draining the queue so log_line() and flush() never block
+            logger.exception("Writing log file failed; further lines are dropped.")
+            failed = True
+        finally:
+            for _ in items:
+                q.task_done()
+        if done:
+            return
@@ -1,20 +1,34 @@
 from __future__ import annotations
 
+import codecs
 import logging
+from copy import deepcopy
+from enum import IntEnum
+from functools import lru_cache
+from operator import attrgetter
 from pathlib import Path
+from typing import TYPE_CHECKING, Callable, Final, NamedTuple
 
 logger = logging.getLogger(__name__)
 
-from PySide6.QtCore import QCoreApplication, QSettings, Qt, Slot
-from PySide6.QtGui import QAction, QCloseEvent, QIcon
+from PySide6.QtCore import (
+    QByteArray,
+    QCoreApplication,
+    QSignalBlocker,
+    QSize,
+    QThread,
+    QTimer,
+    Qt,
+    Slot,
+)
+from PySide6.QtGui import QAction, QCloseEvent, QIcon, QMoveEvent, QResizeEvent
 from PySide6.QtWidgets import (
     QApplication,
-    QFileDialog,
     QDialog,
-    QDialogButtonBox,
     QHBoxLayout,
     QLabel,
     QMainWindow,
+    QMenu,
     QMessageBox,
     QPushButton,
     QStatusBar,
@@ -24,11 +38,11 @@ from PySide6.QtWidgets import (
     QVBoxLayout,
     QWidget,
     QSizePolicy,
-    QTextBrowser,
 )
 
 from .config import defaults
 from .config import settings_keys as SK
+from .config.cached_settings import CachedSettings, SettingsWriter
 from .config.migration import migrate_settings
 from .config.plot_config import PlotConfig
 from .data.variable_manager import VariableManager
@@ -37,40 +51,143 @@ from .mqtt import MQTTManager, MQTTSettings
 from .serial.port_manager import PortManager
 from .serial.settings import AppearanceSettings, SerialSettings
 from .ui.console import ConsoleWidget
-from .ui.plot_panel import PlotPanel
-from .ui.serial_parser_dialog import SerialParserDialog
-from .ui.settings_dialog import SettingsDialog
 from .ui.command_toolbar import CommandToolbar
-from .ui.dashboard_window import DashboardWindow
-from .ui.mqtt_monitor import MQTTMonitorWidget
-from .ui.mqtt_settings_dialog import MQTTSettingsDialog
 from .ui.serial_plot_panel import SerialPlotPanel
-from .ui.variable_dialog import VariablesDialog
 from .ui.devices_widget import DevicesWidget
 from .ui.firmware_widget import FirmwareWidget
-from .ui.help_window import HelpWindow
 from .ui.history_line_edit import CommandHistoryLineEdit
 from .version import __version__
 
 from .config.paths import static_dir
 
+# Dialogs and rarely used widgets are imported where they are first built.
+if TYPE_CHECKING:
+    from PySide6.QtWidgets import QFileDialog
+
+    from .ui.dashboard_window import DashboardWindow
+    from .ui.help_window import HelpWindow
+    from .ui.mqtt_monitor import MQTTMonitorWidget
+    from .ui.mqtt_settings_dialog import MQTTSettingsDialog
+    from .ui.settings_dialog import SettingsDialog
+
 _STATIC_DIR = static_dir()
+_SAVE_DELAY_MS = 5000
+_RX_COALESCE_MS = 16  # one 60 Hz frame
+_LOG_STATUS_INTERVAL_MS = 500
+_STATUS_COALESCE_MS = 100
+_BYTE_UNITS: Final = ("B", "KB", "MB", "GB", "TB", "PB")
+
+
+class _LinkState(IntEnum):
+    """Connection state shown by the status-bar indicators."""
+
+    DISCONNECTED = 0
+    WAITING = 1
+    CONNECTED = 2
+
+
+# Indicator stylesheets indexed by _LinkState, built once
+_STATUS_ICON_CSS: Final = tuple(
+    f"background-color: {color}; border-radius: 6px;"
+    for color in ("#c62828", "#f9a825", "#2e7d32")
+)
+
+# SerialSettings fields that PortManager.open() uses; changing any other
+# field does not require reopening the port.
+_port_parameters = attrgetter(
+    "port_name",
+    "baud_rate",
+    "data_bits",
+    "parity",
+    "stop_bits",
+    "flow_control",
+    "dtr_on_connect",
+)
+
+
+class _MenuItem(NamedTuple):
+    text: str
+    slot: str  # attribute path on MainWindow, e.g. "_console.clear"
+    attr: str = ""  # MainWindow attribute to keep the action in, if it is needed later
+    role: QAction.MenuRole = QAction.MenuRole.TextHeuristicRole
+
+
+# Keeps "Configure..." entries out of the macOS application menu
+_NO_ROLE = QAction.MenuRole.NoRole
+
+# Top-level menus and their entries; None adds a separator.
+_MENU_SPEC: Final[tuple[tuple[str, tuple[_MenuItem | None, ...]], ...]] = (
+    ("File", (
+        _MenuItem("Load preset...", "_command_toolbar.load_preset_via_dialog"),
+        _MenuItem("Clear preset", "_command_toolbar.clear_preset"),
+        None,
+        _MenuItem("Quit", "close"),
+    )),
+    ("Serial", (
+        _MenuItem("Configure...", "_open_settings", role=_NO_ROLE),
+        _MenuItem("Parser...", "_open_serial_parser", role=_NO_ROLE),
+        _MenuItem("Clear terminal", "_console.clear"),
+        None,
+        _MenuItem("Start logging...", "_start_logging", "_action_log_start"),
+        _MenuItem("Stop logging", "_stop_logging", "_action_log_stop"),
+        None,
+        _MenuItem("Save command history...", "_save_command_history"),
+    )),
+    ("MQTT", (
+        _MenuItem("Configure...", "_open_mqtt_settings", role=_NO_ROLE),
+    )),
+    ("Variables", (
+        _MenuItem("Manage Variables...", "_open_variables_dialog"),
+    )),
+    ("Dashboard", (
+        _MenuItem("Add plot", "_add_plot"),
+        _MenuItem("Remove plot", "_remove_plot"),
+        _MenuItem("Setup plot...", "_setup_plot"),
+        _MenuItem("Clear plot", "_clear_plot"),
+        None,
+        _MenuItem("Tile plots", "_tile_plots"),
+        _MenuItem("Cascade plots", "_cascade_plots"),
+    )),
+    ("Firmware", (
+        _MenuItem("Load device config…", "_firmware_widget.load_config_dialog"),
+    )),
+    ("Help", (
+        _MenuItem("Help", "_show_help"),
+        _MenuItem("About", "_show_about"),
+    )),
+)
+
+
+@lru_cache(maxsize=128)
+def _encode_command(command: str) -> bytes:
+    """UTF-8 bytes for a preset command; toolbar buttons resend the same few strings."""
+    return command.encode("utf-8")
+
+
+def _svg_icon(name: str, fallback: QStyle.StandardPixmap) -> QIcon:
+    """Icon for static/*name*, rendered once at toolbar size, or a style icon."""
+    path = _STATIC_DIR / name
+    style = QApplication.style()
+    if not path.exists():
+        return style.standardIcon(fallback)
+    # A pixmap icon: switching the toggle icons never re-renders the SVG.
+    extent = style.pixelMetric(QStyle.PixelMetric.PM_ToolBarIconSize)
+    ratio = QApplication.instance().devicePixelRatio()
+    icon = QIcon()
+    icon.addPixmap(QIcon(str(path)).pixmap(QSize(extent, extent), ratio))
+    return icon
 
 
+# QIcons need a QGuiApplication; these are only called from MainWindow,
+# which cannot exist without one, so building on first call is safe.
+@lru_cache(maxsize=None)
 def _connect_icon() -> QIcon:
-    path = _STATIC_DIR / "connected.svg"
-    if path.exists():
-        return QIcon(str(path))
-    return QApplication.style().standardIcon(QStyle.StandardPixmap.SP_ArrowForward)
+    return _svg_icon("connected.svg", QStyle.StandardPixmap.SP_ArrowForward)
 
 
+@lru_cache(maxsize=None)
 def _disconnect_icon() -> QIcon:
-    path = _STATIC_DIR / "disconnected.svg"
-    if path.exists():
-        return QIcon(str(path))
-    return QApplication.style().standardIcon(
-        QStyle.StandardPixmap.SP_TitleBarCloseButton
-    )
+    return _svg_icon("disconnected.svg", QStyle.StandardPixmap.SP_TitleBarCloseButton)
 
 
 class MainWindow(QMainWindow):
@@ -84,10 +201,20 @@ class MainWindow(QMainWindow):
         if icon_path.exists():
             self.setWindowIcon(QIcon(str(icon_path)))
 
-        self._settings = QSettings()
+        self._settings = CachedSettings()
+        # Disk flushes of the settings file happen off the GUI thread
+        self._settings_thread = QThread(self)
+        self._settings_writer = SettingsWriter(
+            self._settings.fileName(), self._settings.format()
+        )
+        self._settings_writer.moveToThread(self._settings_thread)
+        self._settings_thread.start()
+        self._settings.set_writer(self._settings_writer)
         migrate_settings(self._settings)
         self._serial_settings = SerialSettings.from_qsettings(self._settings)
         self._appearance_settings = AppearanceSettings.from_qsettings(self._settings)
+        # Snapshot what is stored, so the fix below is written back on save
+        stored_appearance = deepcopy(self._appearance_settings)
         if self._appearance_settings.background_color.lower() in ("#000000", "black"):
             text_color = self._appearance_settings.text_color.lower()
             if text_color in ("#00ff00", "green"):
@@ -96,15 +223,26 @@ class MainWindow(QMainWindow):
 
         self._port_manager = PortManager(self)
         self._port_manager.data_received.connect(self._on_data_received)
+        # Reads are gathered and handled at most once per frame
+        self._rx_buffer = bytearray()
+        self._rx_timer = QTimer(self)
+        self._rx_timer.setSingleShot(True)
+        self._rx_timer.setInterval(_RX_COALESCE_MS)
+        self._rx_timer.timeout.connect(self._process_received)
+        # Keeps a multi-byte character split across reads until it is complete
+        self._utf8_decoder = codecs.getincrementaldecoder("utf-8")("replace")
         self._port_manager.connection_changed.connect(self._on_connection_changed)
         self._port_manager.error.connect(self._on_serial_error)
         self._port_manager.reconnecting.connect(self._on_reconnecting)
 
         self._file_logger = FileLogger()
+        # Read on every received chunk; kept in step with _start/_stop_logging
+        self._logger_active = False
+        self._refresh_cached_serial()
 
-        self._settings_dialog = SettingsDialog(self)
-        self._settings_dialog.load(self._serial_settings, self._appearance_settings)
-        self._settings_dialog.settings_applied.connect(self._apply_settings)
+        # Built on first use: the settings dialog and the dashboard (with its
+        # pyqtgraph import chain) are not needed to bring up the window.
+        self._settings_dialog: SettingsDialog | None = None
 
         self._console = ConsoleWidget()
         self._console.set_appearance(
@@ -140,26 +278,27 @@ class MainWindow(QMainWindow):
         self._variable_manager = VariableManager(self._settings, self)
 
         self._plot_config = PlotConfig.from_qsettings(self._settings)
-        self._dashboard_window = DashboardWindow(
-            self._settings,
-            self._plot_config,
-            variable_list_fn=self._variable_manager.get_variable_list,
-            parent=self,
-        )
-        self._variable_manager.variables_changed.connect(
-            self._dashboard_window.on_variables_changed
-        )
+        self._dashboard_window: DashboardWindow | None = None
 
         self._mqtt_settings = MQTTSettings.from_qsettings(self._settings)
+        # What the store holds for each settings object; unchanged ones are not rewritten.
+        self._saved_configs: dict[type, object] = {AppearanceSettings: stored_appearance}
+        for config in (
+            self._serial_settings,
+            self._plot_config,
+            self._mqtt_settings,
+        ):
+            self._saved_configs[type(config)] = deepcopy(config)
+        self._geometry_changed = False
         self._mqtt_manager = MQTTManager(self)
-        self._mqtt_manager.message_received.connect(self._on_mqtt_message)
+        self._mqtt_manager.messages_batch.connect(self._on_mqtt_messages)
         self._mqtt_manager.connection_changed.connect(self._on_mqtt_connection_changed)
         self._mqtt_manager.error.connect(self._on_mqtt_error)
-        self._mqtt_settings_dialog = MQTTSettingsDialog(self)
-        self._mqtt_monitor_widget = MQTTMonitorWidget(self._variable_manager, self)
-        self._mqtt_monitor_widget.set_values_callback(self._on_mqtt_plot_values)
+        self._mqtt_settings_dialog: MQTTSettingsDialog | None = None
+        self._help_window: HelpWindow | None = None
+        self._mqtt_monitor_widget: MQTTMonitorWidget | None = None
 
-        self._serial_plot_panel = SerialPlotPanel(self._variable_manager, self)
+        self._serial_plot_panel = SerialPlotPanel(self._variable_manager, self, self._settings)
         terminal_widget.layout().addWidget(self._serial_plot_panel)
 
         self._tabs = QTabWidget()
@@ -168,17 +307,19 @@ class MainWindow(QMainWindow):
         self._devices_tab_index = self._tabs.addTab(self._devices_widget, "Devices")
 
         self._terminal_tab_index = self._tabs.addTab(terminal_widget, "Terminal")
-        self._mqtt_tab_index = self._tabs.addTab(self._mqtt_monitor_widget, "MQTT")
-        self._dashboard_tab_index = self._tabs.addTab(self._dashboard_window, "Dashboard")
+        # Placeholders, swapped for the real widgets by _replace_placeholder_tab.
+        self._mqtt_tab_index = self._tabs.addTab(QWidget(), "MQTT")
+        self._dashboard_tab_index = self._tabs.addTab(QWidget(), "Dashboard")
 
-        self._firmware_widget = FirmwareWidget(self)
+        self._firmware_widget = FirmwareWidget(self, self._settings)
         self._firmware_tab_index = self._tabs.addTab(self._firmware_widget, "Firmware")
         self._firmware_widget.port_release_requested.connect(self._release_port_for_upload)
         self._firmware_widget.upload_complete.connect(self._reclaim_port_after_upload)
         self._port_released_for_upload = False
         self._tabs.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding)
+        self._tabs.currentChanged.connect(self._on_tab_changed)
 
-        self._command_toolbar = CommandToolbar(self)
+        self._command_toolbar = CommandToolbar(self, self._settings)
         self._command_toolbar.setObjectName("CommandsToolbar")
         self._command_toolbar.command_requested.connect(self._send_command)
         self._command_toolbar.preset_loaded.connect(self._store_last_preset_path)
@@ -195,18 +336,25 @@ class MainWindow(QMainWindow):
         self._status = QStatusBar()
         self.setStatusBar(self._status)
         self._status_icon = QLabel()
-        self._status_label = QLabel("Disconnected")
+        self._status_icon.setFixedSize(12, 12)
+        # Serial state and log info share one label; see _refresh_status().
+        # The " |" separators are part of the label texts, not widgets of their own.
+        self._state_text = "Disconnected"
+        self._log_text = ""
+        self._status_label = QLabel()
+        self._refresh_status()
+        # Bursts of state/log changes (error storms, reconnects) update the label once
+        self._status_timer = QTimer(self)
+        self._status_timer.setSingleShot(True)
+        self._status_timer.setInterval(_STATUS_COALESCE_MS)
+        self._status_timer.timeout.connect(self._refresh_status)
         self._status.addWidget(self._status_icon)
         self._status.addWidget(self._status_label)
-        self._status.addWidget(QLabel(" | "))
         self._status_mqtt_icon = QLabel()
-        self._status_mqtt_label = QLabel("MQTT: Disconnected")
+        self._status_mqtt_icon.setFixedSize(12, 12)
+        self._status_mqtt_label = QLabel("MQTT: Disconnected |")
         self._status.addWidget(self._status_mqtt_icon)
         self._status.addWidget(self._status_mqtt_label)
-        self._status.addWidget(QLabel(" | "))
-        self._status_log_label = QLabel("")
-        self._status.addWidget(self._status_log_label)
-        self._status.addWidget(QLabel(" | "))
         self._status_line_count_label = QLabel("")
         self._status.addWidget(self._status_line_count_label)
         self._console.line_count_changed.connect(self._on_line_count_changed)
@@ -221,147 +369,166 @@ class MainWindow(QMainWindow):
         self._console.scroll_lock_changed.connect(self._on_scroll_lock_changed)
 
         self._reconnecting = False
-        self._set_status_state("disconnected")
-        self._set_mqtt_status_state("disconnected")
+        # Last serial error shown in a dialog; repeats only go to the status bar.
+        self._last_shown_error: str | None = None
+        self._link_state: _LinkState | None = None
+        self._mqtt_link_state: _LinkState | None = None
+        self._set_status_state(_LinkState.DISCONNECTED)
+        self._set_mqtt_status_state(_LinkState.DISCONNECTED)
         self._log_path: Path | None = None
+        self._last_log_path: str = self._settings.value(SK.LOGGING_LAST_PATH, "", str)
+        self._last_preset_path: str = self._settings.value(SK.COMMANDS_LAST_PATH, "", str)
+        self._log_dialog: QFileDialog | None = None
+        self._log_mode = "a"
+        # The log size in the status bar needs a stat(); refresh it at most twice a second
+        self._log_status_timer = QTimer(self)
+        self._log_status_timer.setSingleShot(True)
+        self._log_status_timer.setInterval(_LOG_STATUS_INTERVAL_MS)
+        self._log_status_timer.timeout.connect(self._update_log_status)
 
         self._create_actions()
         self._restore_window_state()
-        self._restore_last_preset()
-        self._firmware_widget.restore_last_config()
+        # Preset and firmware config files are parsed once the window is up
+        QTimer.singleShot(0, self._restore_last_preset)
+        QTimer.singleShot(0, self._firmware_widget.restore_last_config)
 
         self._port_manager.set_auto_reconnect(self._serial_settings.auto_reconnect)
 
+        # Settings changes are persisted together a few seconds later (or on close)
+        self._save_timer = QTimer(self)
+        self._save_timer.setSingleShot(True)
+        self._save_timer.setInterval(_SAVE_DELAY_MS)
+        self._save_timer.timeout.connect(self._save_settings)
+
+    def moveEvent(self, event: QMoveEvent) -> None:
+        self._geometry_changed = True
+        super().moveEvent(event)
+
+    def resizeEvent(self, event: QResizeEvent) -> None:
+        self._geometry_changed = True
+        super().resizeEvent(event)
+
     def closeEvent(self, event: QCloseEvent) -> None:
+        # The final flush must be complete when the window goes away
+        self._settings.set_writer(None)
         self._save_settings()
+        self._settings_thread.quit()
+        self._settings_thread.wait()
         self._firmware_widget.cancel_if_running()
-        if self._file_logger.is_active():
+        self._process_received()
+        if self._logger_active:
             self._file_logger.stop()
+            self._logger_active = False
         if self._mqtt_manager.is_connected():
             self._mqtt_manager.disconnect_()
         super().closeEvent(event)
 
     def _create_actions(self) -> None:
-        menu = self.menuBar()
+        # Menu actions are created the first time each menu is opened; only
+        # the connection toolbar is needed to bring up the window.
+        menu_bar = self.menuBar()
+        menu_bar.setUpdatesEnabled(False)
+        menus = {title: self._add_lazy_menu(title, items) for title, items in _MENU_SPEC}
+        menus["Serial"].aboutToShow.connect(self._update_log_actions)
+        menu_bar.setUpdatesEnabled(True)
 
-        file_menu = menu.addMenu("File")
         self._action_connect_toggle = QAction("Serial Disconnected", self)
         self._action_connect_toggle.setIcon(_disconnect_icon())
         self._action_connect_toggle.setCheckable(True)
-        self._action_quit = QAction("Quit", self)
-        self._action_quit.triggered.connect(self.close)
         self._action_connect_toggle.triggered.connect(self._toggle_connection)
-        serial_menu = menu.addMenu("Serial")
-        self._action_settings = QAction("Configure...", self)
-        self._action_settings.setMenuRole(QAction.MenuRole.NoRole)
-        self._action_settings.triggered.connect(self._open_settings)
-        self._action_parser = QAction("Parser...", self)
-        self._action_parser.setMenuRole(QAction.MenuRole.NoRole)
-        self._action_parser.triggered.connect(self._open_serial_parser)
-        self._action_clear = QAction("Clear terminal", self)
-        self._action_clear.triggered.connect(self._console.clear)
-        self._action_log_start = QAction("Start logging...", self)
-        self._action_log_stop = QAction("Stop logging", self)
-        self._action_log_stop.setEnabled(False)
-        self._action_log_start.triggered.connect(self._start_logging)
-        self._action_log_stop.triggered.connect(self._stop_logging)
-        serial_menu.addAction(self._action_settings)
-        serial_menu.addAction(self._action_parser)
-        serial_menu.addAction(self._action_clear)
-        self._action_save_history = QAction("Save command history...", self)
-        self._action_save_history.triggered.connect(self._save_command_history)
-        serial_menu.addSeparator()
-        serial_menu.addAction(self._action_log_start)
-        serial_menu.addAction(self._action_log_stop)
-        serial_menu.addSeparator()
-        serial_menu.addAction(self._action_save_history)
-
-        mqtt_menu = menu.addMenu("MQTT")
-        self._action_mqtt_settings = QAction("Configure...", self)
-        self._action_mqtt_settings.setMenuRole(QAction.MenuRole.NoRole)
-        self._action_mqtt_settings.triggered.connect(self._open_mqtt_settings)
-        mqtt_menu.addAction(self._action_mqtt_settings)
-
-        # -- Variables menu --
-        variables_menu = menu.addMenu("Variables")
-        self._action_manage_variables = QAction("Manage Variables...", self)
-        self._action_manage_variables.triggered.connect(self._open_variables_dialog)
-        variables_menu.addAction(self._action_manage_variables)
-
-        view_menu = menu.addMenu("Dashboard")
-        view_menu.addSeparator()
-        self._action_add_plot = QAction("Add plot", self)
-        self._action_remove_plot = QAction("Remove plot", self)
-        self._action_setup_plot = QAction("Setup plot...", self)
-        self._action_clear_plot = QAction("Clear plot", self)
-        self._action_add_plot.triggered.connect(self._add_plot)
-        self._action_remove_plot.triggered.connect(self._remove_plot)
-        self._action_setup_plot.triggered.connect(self._setup_plot)
-        self._action_clear_plot.triggered.connect(self._clear_plot)
-        view_menu.addAction(self._action_add_plot)
-        view_menu.addAction(self._action_remove_plot)
-        view_menu.addAction(self._action_setup_plot)
-        view_menu.addAction(self._action_clear_plot)
-        view_menu.addSeparator()
-        self._action_tile_plots = QAction("Tile plots", self)
-        self._action_cascade_plots = QAction("Cascade plots", self)
-        self._action_tile_plots.triggered.connect(self._tile_plots)
-        self._action_cascade_plots.triggered.connect(self._cascade_plots)
-        view_menu.addAction(self._action_tile_plots)
-        view_menu.addAction(self._action_cascade_plots)
-
-        firmware_menu = menu.addMenu("Firmware")
-        self._action_load_firmware_config = QAction("Load device config…", self)
-        self._action_load_firmware_config.triggered.connect(
-            self._firmware_widget.load_config_dialog
-        )
-        firmware_menu.addAction(self._action_load_firmware_config)
-
-        help_menu = menu.addMenu("Help")
-        self._action_help = QAction("Help", self)
-        self._action_help.triggered.connect(self._show_help)
-        self._action_about = QAction("About", self)
-        self._action_about.triggered.connect(self._show_about)
-        help_menu.addAction(self._action_help)
-        help_menu.addAction(self._action_about)
-
-        file_menu.addSeparator()
-        self._action_load_preset = QAction("Load preset...", self)
-        self._action_clear_preset = QAction("Clear preset", self)
-        self._action_load_preset.triggered.connect(
-            self._command_toolbar.load_preset_via_dialog
-        )
-        self._action_clear_preset.triggered.connect(
-            self._command_toolbar.clear_preset
-        )
-        file_menu.addAction(self._action_load_preset)
-        file_menu.addAction(self._action_clear_preset)
-        file_menu.addSeparator()
-        file_menu.addAction(self._action_quit)
-
-        self._connection_toolbar = self.addToolBar("Connection")
-        self._connection_toolbar.setObjectName("ConnectionToolbar")
-        self._connection_toolbar.setMovable(False)
-        self._connection_toolbar.addAction(self._action_connect_toggle)
-        connect_btn = self._connection_toolbar.widgetForAction(self._action_connect_toggle)
-        if connect_btn:
-            connect_btn.setMinimumHeight(40)
-            connect_btn.setToolButtonStyle(Qt.ToolButtonStyle.ToolButtonTextBesideIcon)
         self._action_mqtt_connect_toggle = QAction("MQTT Disconnected", self)
         self._action_mqtt_connect_toggle.setIcon(_disconnect_icon())
         self._action_mqtt_connect_toggle.setCheckable(True)
         self._action_mqtt_connect_toggle.triggered.connect(self._toggle_mqtt_connection)
-        self._connection_toolbar.addAction(self._action_mqtt_connect_toggle)
-        mqtt_btn = self._connection_toolbar.widgetForAction(self._action_mqtt_connect_toggle)
-        if mqtt_btn:
-            mqtt_btn.setMinimumHeight(40)
-            mqtt_btn.setToolButtonStyle(Qt.ToolButtonStyle.ToolButtonTextBesideIcon)
 
-        self._action_connect_toggle.setChecked(False)
-        self._action_mqtt_connect_toggle.setChecked(False)
+        self._connection_toolbar = self.addToolBar("Connection")
+        self._connection_toolbar.setObjectName("ConnectionToolbar")
+        self._connection_toolbar.setMovable(False)
+        toggles = [self._action_connect_toggle, self._action_mqtt_connect_toggle]
+        self._connection_toolbar.addActions(toggles)
+        for action in toggles:
+            button = self._connection_toolbar.widgetForAction(action)
+            if button:
+                button.setMinimumHeight(40)
+                button.setToolButtonStyle(Qt.ToolButtonStyle.ToolButtonTextBesideIcon)
+
+    def _add_lazy_menu(self, title: str, items: tuple[_MenuItem | None, ...]) -> QMenu:
+        """Add a top-level menu whose *items* are built just before it first opens."""
+        menu = self.menuBar().addMenu(title)
+
+        def build() -> None:
+            menu.aboutToShow.disconnect(build)
+            self._populate_menu(menu, items)
+
+        menu.aboutToShow.connect(build)
+        return menu
+
+    def _populate_menu(self, menu: QMenu, items: tuple[_MenuItem | None, ...]) -> None:
+        for item in items:
+            if item is None:
+                menu.addSeparator()
+                continue
+            action = QAction(item.text, self)
+            action.setMenuRole(item.role)
+            action.triggered.connect(attrgetter(item.slot)(self))
+            menu.addAction(action)
+            if item.attr:
+                setattr(self, item.attr, action)
+
+    def _update_log_actions(self) -> None:
+        self._action_log_start.setEnabled(not self._logger_active)
+        self._action_log_stop.setEnabled(self._logger_active)
+
+    def _get_dashboard(self) -> DashboardWindow:
+        """Return the dashboard, building it in place of its placeholder tab on first use."""
+        if self._dashboard_window is None:
+            from .ui.dashboard_window import DashboardWindow
+
+            dashboard = DashboardWindow(
+                self._settings,
+                self._plot_config,
+                variable_list_fn=self._variable_manager.get_variable_list,
+                parent=self,
+            )
+            self._dashboard_window = dashboard
+            self._variable_manager.variables_changed.connect(dashboard.on_variables_changed)
+            self._replace_placeholder_tab(self._dashboard_tab_index, dashboard, "Dashboard")
+            dashboard.restore_state()
+        return self._dashboard_window
+
+    def _get_mqtt_monitor(self) -> MQTTMonitorWidget:
+        """Return the MQTT monitor, building it on first use (tab shown or first message)."""
+        if self._mqtt_monitor_widget is None:
+            from .ui.mqtt_monitor import MQTTMonitorWidget
+
+            monitor = MQTTMonitorWidget(self._variable_manager, self)
+            monitor.set_values_callback(self._on_mqtt_plot_values)
+            self._mqtt_monitor_widget = monitor
+            self._replace_placeholder_tab(self._mqtt_tab_index, monitor, "MQTT")
+        return self._mqtt_monitor_widget
+
+    def _replace_placeholder_tab(self, index: int, widget: QWidget, title: str) -> None:
+        placeholder = self._tabs.widget(index)
+        current = self._tabs.currentIndex()
+        self._tabs.removeTab(index)
+        self._tabs.insertTab(index, widget, title)
+        self._tabs.setCurrentIndex(current)
+        placeholder.deleteLater()
+
+    @Slot(int)
+    def _on_tab_changed(self, index: int) -> None:
+        if index == self._dashboard_tab_index and self._dashboard_window is None:
+            self._get_dashboard()
+        elif index == self._mqtt_tab_index and self._mqtt_monitor_widget is None:
+            self._get_mqtt_monitor()
 
     @Slot()
     def _open_settings(self) -> None:
+        if self._settings_dialog is None:
+            from .ui.settings_dialog import SettingsDialog
+
+            self._settings_dialog = SettingsDialog(self, self._settings)
+            self._settings_dialog.settings_applied.connect(self._apply_settings)
         self._settings_dialog.refresh_ports()
         self._settings_dialog.load(
             self._serial_settings,
@@ -376,6 +543,8 @@ class MainWindow(QMainWindow):
     @Slot()
     def _open_serial_parser(self) -> None:
         """Open the Serial parser dialog (CSV / JSON)."""
+        from .ui.serial_parser_dialog import SerialParserDialog
+
         dialog = SerialParserDialog(
             self._variable_manager.serial_config,
             parent=self,
@@ -396,10 +565,16 @@ class MainWindow(QMainWindow):
         serial_settings: SerialSettings,
         appearance_settings: AppearanceSettings,
     ) -> None:
-        self._serial_settings = serial_settings
-        self._appearance_settings = appearance_settings
-        self._apply_appearance()
-        self._port_manager.set_auto_reconnect(self._serial_settings.auto_reconnect)
+        serial_changed = serial_settings != self._serial_settings
+        port_changed = _port_parameters(serial_settings) != _port_parameters(self._serial_settings)
+        appearance_changed = appearance_settings != self._appearance_settings
+        if serial_changed:
+            self._serial_settings = serial_settings
+            self._refresh_cached_serial()
+            self._port_manager.set_auto_reconnect(serial_settings.auto_reconnect)
+        if appearance_changed:
+            self._appearance_settings = appearance_settings
+            self._apply_appearance()
 
         max_blocks = self._settings.value(
             SK.CONSOLE_MAX_BLOCK_COUNT, defaults.DEFAULT_CONSOLE_MAX_BLOCK_COUNT, int
@@ -411,24 +586,39 @@ class MainWindow(QMainWindow):
         )
         self._input_line.set_max_length(history_max)
 
-        if self._port_manager.is_open():
+        if port_changed and self._port_manager.is_open():
             self._port_manager.close()
             self._connect_serial()
-        self._save_settings()
+        # Console and history limits are stored by the dialog itself
+        if serial_changed or appearance_changed:
+            self._save_timer.start()
 
     @Slot()
     def _connect_serial(self) -> None:
-        if not self._serial_settings.port_name:
-            QMessageBox.warning(self, "Serial", "No serial port selected.")
+        port = self._serial_settings.port_name
+        if not port:
+            self._report_serial_error("No serial port selected.", QMessageBox.warning)
             self._action_connect_toggle.setChecked(False)
             return
         opened = self._port_manager.open(self._serial_settings)
         if not opened:
-            QMessageBox.critical(
-                self, "Serial", "Failed to open serial port."
+            self._report_serial_error(
+                f"Failed to open {port}: {self._port_manager.error_string()}",
+                QMessageBox.critical,
             )
             self._action_connect_toggle.setChecked(False)
 
+    def _report_serial_error(
+        self,
+        message: str,
+        show_box: Callable[[QWidget, str, str], object],
+    ) -> None:
+        """Show *message* in the status bar, and in a dialog unless it was the last one shown."""
+        self._set_state_text(f"Error: {message}")
+        if message != self._last_shown_error:
+            self._last_shown_error = message
+            show_box(self, "Serial", message)
+
     def _toggle_connection(self, checked: bool) -> None:
         if checked:
             self._connect_serial()
@@ -459,20 +649,21 @@ class MainWindow(QMainWindow):
 
     @Slot(bool)
     def _on_connection_changed(self, connected: bool) -> None:
+        if not connected:
+            # Handle what is still buffered, then drop any half character
+            self._process_received()
+            self._utf8_decoder.reset()
         if connected:
-            self._action_connect_toggle.setChecked(True)
-            self._action_connect_toggle.setText("Serial Connected")
-            self._action_connect_toggle.setIcon(_connect_icon())
-            self._status_label.setText(self._connection_status_text())
-            self._set_status_state("connected")
+            self._last_shown_error = None
+            self._set_toggle(self._action_connect_toggle, True, "Serial Connected")
+            self._set_state_text(self._connection_status_text())
+            self._set_status_state(_LinkState.CONNECTED)
         elif not self._reconnecting:
             # Only flip to Disconnected when we are not in the waiting-for-device state;
             # _on_reconnecting handles the button label in that case.
-            self._action_connect_toggle.setChecked(False)
-            self._action_connect_toggle.setText("Serial Disconnected")
-            self._action_connect_toggle.setIcon(_disconnect_icon())
-            self._status_label.setText("Disconnected")
-            self._set_status_state("disconnected")
+            self._set_toggle(self._action_connect_toggle, False, "Serial Disconnected")
+            self._set_state_text("Disconnected")
+            self._set_status_state(_LinkState.DISCONNECTED)
         if connected and self._reconnecting:
             self._console.append_status_message(
                 "Device reconnected.",
@@ -483,17 +674,17 @@ class MainWindow(QMainWindow):
 
     @Slot(str)
     def _on_serial_error(self, message: str) -> None:
-        self._status_label.setText(f"Error: {message}")
+        self._set_state_text(f"Error: {message}")
 
     @Slot(bool)
     def _on_reconnecting(self, reconnecting: bool) -> None:
         if reconnecting:
             port = self._serial_settings.port_name or "device"
-            self._status_label.setText(f"Waiting for {port}")
-            self._set_status_state("waiting")
-            self._action_connect_toggle.setChecked(True)
-            self._action_connect_toggle.setText("Serial Waiting")
-            self._action_connect_toggle.setIcon(_disconnect_icon())
+            self._set_state_text(f"Waiting for {port}")
+            self._set_status_state(_LinkState.WAITING)
+            self._set_toggle(
+                self._action_connect_toggle, True, "Serial Waiting", _disconnect_icon()
+            )
             if not self._reconnecting:
                 self._console.append_status_message(
                     "Waiting for device connection...",
@@ -504,44 +695,71 @@ class MainWindow(QMainWindow):
         else:
             self._reconnecting = False
             if self._port_manager.is_open():
-                self._status_label.setText(self._connection_status_text())
-                self._set_status_state("connected")
+                self._set_state_text(self._connection_status_text())
+                self._set_status_state(_LinkState.CONNECTED)
             else:
-                self._action_connect_toggle.setChecked(False)
-                self._action_connect_toggle.setText("Serial Disconnected")
-                self._action_connect_toggle.setIcon(_disconnect_icon())
-                self._status_label.setText("Disconnected")
-                self._set_status_state("disconnected")
-
-    def _set_status_state(self, state: str) -> None:
-        colors = {
-            "connected": "#2e7d32",
-            "waiting": "#f9a825",
-            "disconnected": "#c62828",
-        }
-        color = colors.get(state, "#9e9e9e")
-        self._status_icon.setStyleSheet(
-            f"background-color: {color}; border-radius: 6px;"
-        )
-        self._status_icon.setFixedSize(12, 12)
+                self._set_toggle(self._action_connect_toggle, False, "Serial Disconnected")
+                self._set_state_text("Disconnected")
+                self._set_status_state(_LinkState.DISCONNECTED)
 
-    def _set_mqtt_status_state(self, state: str) -> None:
-        colors = {
-            "connected": "#2e7d32",
-            "disconnected": "#c62828",
-        }
-        color = colors.get(state, "#c62828")
-        self._status_mqtt_icon.setStyleSheet(
-            f"background-color: {color}; border-radius: 6px;"
-        )
-        self._status_mqtt_icon.setFixedSize(12, 12)
+    def _set_toggle(
+        self,
+        action: QAction,
+        checked: bool,
+        text: str,
+        icon: QIcon | None = None,
+    ) -> None:
+        """Show a connection toggle as *checked* with *text*; unchanged parts are left alone.
+
+        The icon defaults to the connected/disconnected one matching *checked*.
+        """
+        if action.isChecked() != checked:
+            # Programmatic state only; must not re-run the toggle slot
+            with QSignalBlocker(action):
+                action.setChecked(checked)
+        if action.text() != text:
+            action.setText(text)
+            if icon is None:
+                icon = _connect_icon() if checked else _disconnect_icon()
+            action.setIcon(icon)
+
+    def _set_state_text(self, text: str) -> None:
+        self._state_text = text
+        if not self._status_timer.isActive():
+            self._status_timer.start()
+
+    def _set_log_text(self, text: str) -> None:
+        self._log_text = text
+        if not self._status_timer.isActive():
+            self._status_timer.start()
+
+    def _refresh_status(self) -> None:
+        if self._log_text:
+            self._status_label.setText(f"{self._state_text} | {self._log_text} |")
+        else:
+            self._status_label.setText(f"{self._state_text} |")
+
+    def _set_status_state(self, state: _LinkState) -> None:
+        # Reconnect attempts repeat the same state; don't restyle for nothing
+        if state == self._link_state:
+            return
+        self._link_state = state
+        self._status_icon.setStyleSheet(_STATUS_ICON_CSS[state])
+
+    def _set_mqtt_status_state(self, state: _LinkState) -> None:
+        if state == self._mqtt_link_state:
+            return
+        self._mqtt_link_state = state
+        self._status_mqtt_icon.setStyleSheet(_STATUS_ICON_CSS[state])
         self._status_mqtt_label.setText(
-            "MQTT: Connected" if state == "connected" else "MQTT: Disconnected"
+            "MQTT: Connected |" if state == _LinkState.CONNECTED else "MQTT: Disconnected |"
         )
 
-    @Slot(str, bytes)
-    def _on_mqtt_message(self, topic: str, payload: bytes) -> None:
-        self._mqtt_monitor_widget.on_message_received(topic, payload)
+    @Slot(list)
+    def _on_mqtt_messages(self, messages: list[tuple[str, bytes]]) -> None:
+        on_message = self._get_mqtt_monitor().on_message_received
+        for topic, payload in messages:
+            on_message(topic, payload)
 
     def _on_mqtt_plot_values(self, values_by_name: dict[str, float]) -> None:
         """Update MQTT values via VariableManager and push to dashboard."""
@@ -550,6 +768,10 @@ class MainWindow(QMainWindow):
             self._dashboard_window.handle_values(all_values, updated_names=updated_names)
 
     def _open_mqtt_settings(self) -> None:
+        if self._mqtt_settings_dialog is None:
+            from .ui.mqtt_settings_dialog import MQTTSettingsDialog
+
+            self._mqtt_settings_dialog = MQTTSettingsDialog(self)
         self._mqtt_settings_dialog.load(self._mqtt_settings)
         if self._mqtt_settings_dialog.exec() == QDialog.DialogCode.Accepted:
             self._mqtt_settings = self._mqtt_settings_dialog.settings()
@@ -569,26 +791,33 @@ class MainWindow(QMainWindow):
             self._action_mqtt_connect_toggle.setIcon(_disconnect_icon())
 
     def _on_mqtt_connection_changed(self, connected: bool) -> None:
-        self._action_mqtt_connect_toggle.setChecked(connected)
-        self._action_mqtt_connect_toggle.setText(
-            "MQTT Connected" if connected else "MQTT Disconnected"
+        self._set_toggle(
+            self._action_mqtt_connect_toggle,
+            connected,
+            "MQTT Connected" if connected else "MQTT Disconnected",
         )
-        self._action_mqtt_connect_toggle.setIcon(
-            _connect_icon() if connected else _disconnect_icon()
+        self._set_mqtt_status_state(
+            _LinkState.CONNECTED if connected else _LinkState.DISCONNECTED
         )
-        self._set_mqtt_status_state("connected" if connected else "disconnected")
-        if not connected:
+        if not connected and self._mqtt_monitor_widget is not None:
             self._mqtt_monitor_widget.clear_topics()
 
     def _on_mqtt_error(self, message: str) -> None:
         QMessageBox.warning(self, "MQTT", message)
 
     def _show_help(self) -> None:
-        win = HelpWindow(self)
-        win.setWindowModality(Qt.WindowModality.NonModal)
-        win.show()
+        if self._help_window is None:
+            from .ui.help_window import HelpWindow
+
+            self._help_window = HelpWindow(self)
+            self._help_window.setWindowModality(Qt.WindowModality.NonModal)
+        self._help_window.show()
+        self._help_window.raise_()
+        self._help_window.activateWindow()
 
     def _show_about(self) -> None:
+        from PySide6.QtWidgets import QDialogButtonBox, QTextBrowser
+
         version_text = __version__
         if version_text == "unknown":
             version_text = "unknown (no git info)"
@@ -642,31 +871,59 @@ class MainWindow(QMainWindow):
 
         dlg.exec()
 
-    def _connection_status_text(self) -> str:
+    def _refresh_cached_serial(self) -> None:
+        """Recompute values derived from the serial settings for the send/receive paths."""
         s = self._serial_settings
-        return (
-            f"Connected ({s.port_name}, {s.baud_rate}, "
-            f"{s.data_bits.name}, {s.parity.name}, {s.stop_bits.name}, "
-            f"{s.flow_control.name})"
+        self._timestamp_prefix = s.timestamp_prefix
+        self._line_ending_bytes = s.line_ending.encode("utf-8")
+        self._framing_text = (
+            f"{s.data_bits.name}, {s.parity.name}, {s.stop_bits.name}, {s.flow_control.name}"
         )
 
-    @Slot(bytes)
-    def _on_data_received(self, data: bytes) -> None:
-        text = data.decode("utf-8", errors="replace")
-        lines = self._console.append_data(text, self._serial_settings.timestamp_prefix)
-        has_serial_vars = any(
-            v.source == "serial" for v in self._variable_manager.variables
-        )
-        for line in lines:
-            if self._dashboard_window and has_serial_vars:
-                all_values, updated = self._variable_manager.process_serial_line(line)
-                if updated:
-                    self._dashboard_window.handle_values(all_values, updated_names=updated)
-            if self._file_logger.is_active():
-                self._file_logger.log_line(line)
-                self._update_log_status()
-        if lines:
-            self._variable_manager.set_last_serial_line(lines[-1])
+    def _connection_status_text(self) -> str:
+        s = self._serial_settings
+        return f"Connected ({s.port_name}, {s.baud_rate}, {self._framing_text})"
+
+    @Slot(QByteArray)
+    def _on_data_received(self, data: QByteArray) -> None:
+        # bytearray reads QByteArray through the buffer protocol, so the
+        # chunk is copied once, straight into the receive buffer.
+        self._rx_buffer += data
+        if not self._rx_timer.isActive():
+            self._rx_timer.start()
+
+    @Slot()
+    def _process_received(self) -> None:
+        self._rx_timer.stop()
+        if not self._rx_buffer:
+            return
+        # CPython's UTF-8 decoder already scans ASCII runs word-at-a-time, so
+        # an isascii() pre-check would only add a second pass over the chunk.
+        text = self._utf8_decoder.decode(self._rx_buffer)
+        self._rx_buffer.clear()
+        manager = self._variable_manager
+        has_variables = manager.has_serial_variables()
+        if not has_variables and not self._logger_active:
+            # Nothing consumes the line list; only the preview needs a line.
+            last_line = self._console.append_data_last_line(text, self._timestamp_prefix)
+            if last_line is not None:
+                manager.set_last_serial_line(last_line)
+            return
+        lines = self._console.append_data(text, self._timestamp_prefix)
+        if not lines:
+            return
+        if has_variables:
+            batch = manager.process_serial_batch(lines)
+            dashboard = self._dashboard_window
+            if dashboard is not None:
+                batch = [item for item in batch if item[1]]
+                if batch:
+                    dashboard.handle_values_batch(batch)
+        if self._logger_active:
+            self._file_logger.log_lines(lines)
+            if not self._log_status_timer.isActive():
+                self._log_status_timer.start()
+        manager.set_last_serial_line(lines[-1])
 
     def _send_input_if_enabled(self) -> None:
         if self._serial_settings.send_on_enter:
@@ -677,64 +934,82 @@ class MainWindow(QMainWindow):
         if not raw:
             return
         self._input_line.add_entry(raw)
-        payload = f"{raw}{self._serial_settings.line_ending}"
-        self._port_manager.write(payload.encode("utf-8"))
+        self._port_manager.write(raw.encode("utf-8") + self._line_ending_bytes)
         if self._serial_settings.local_echo:
-            self._console.append_text_colored(f"> {raw}", "#d32f2f")
-        if self._serial_settings.log_commands and self._file_logger.is_active():
+            self._console.append_echo(raw)
+        if self._serial_settings.log_commands and self._logger_active:
             self._file_logger.log_line(f"> {raw}")
         self._input_line.clear()
 
     def _send_command(self, command: str) -> None:
         if not command:
             return
-        self._port_manager.write(command.encode("utf-8"))
-        if self._serial_settings.local_echo:
-            self._console.append_text_colored(f"> {command.rstrip()}", "#d32f2f")
-        if self._serial_settings.log_commands and self._file_logger.is_active():
-            self._file_logger.log_line(f"> {command.rstrip()}")
+        self._port_manager.write(_encode_command(command))
+        settings = self._serial_settings
+        log_command = settings.log_commands and self._logger_active
+        if not (settings.local_echo or log_command):
+            return
+        shown = command.rstrip()
+        if settings.local_echo:
+            self._console.append_echo(shown)
+        if log_command:
+            self._file_logger.log_line(f"> {shown}")
+
+    def _get_log_dialog(self) -> QFileDialog:
+        """Return the log file dialog, creating it (and its Replace button) once."""
+        if self._log_dialog is None:
+            from PySide6.QtWidgets import QDialogButtonBox, QFileDialog
+
+            dialog = QFileDialog(
+                self,
+                "Log file",
+                self._last_log_path,
+                "Text files (*.txt);;All files (*)",
+            )
+            dialog.setAcceptMode(QFileDialog.AcceptMode.AcceptSave)
+            dialog.setOption(QFileDialog.Option.DontUseNativeDialog, True)
+            dialog.setOption(QFileDialog.Option.DontConfirmOverwrite, True)
+            dialog.setLabelText(QFileDialog.DialogLabel.Accept, "Append")
+            button_box = dialog.findChild(QDialogButtonBox)
+            if button_box:
+                append_button = button_box.button(QDialogButtonBox.StandardButton.Save)
+                if append_button:
+                    append_button.clicked.connect(self._set_log_mode_append)
+                replace_button = button_box.addButton(
+                    "Replace",
+                    QDialogButtonBox.ButtonRole.AcceptRole,
+                )
+                replace_button.clicked.connect(self._set_log_mode_replace)
+            self._log_dialog = dialog
+        return self._log_dialog
+
+    def _set_log_mode_append(self) -> None:
+        self._log_mode = "a"
+
+    def _set_log_mode_replace(self) -> None:
+        self._log_mode = "w"
 
     def _start_logging(self) -> None:
-        dialog = QFileDialog(
-            self,
-            "Log file",
-            self._settings.value("logging/last_path", "", str),
-            "Text files (*.txt);;All files (*)",
-        )
-        dialog.setAcceptMode(QFileDialog.AcceptMode.AcceptSave)
-        dialog.setOption(QFileDialog.Option.DontUseNativeDialog, True)
-        dialog.setOption(QFileDialog.Option.DontConfirmOverwrite, True)
-        dialog.setLabelText(QFileDialog.DialogLabel.Accept, "Append")
-        button_box = dialog.findChild(QDialogButtonBox)
-        mode_holder = {"mode": "a"}
-        replace_button = None
-        if button_box:
-            append_button = button_box.button(QDialogButtonBox.StandardButton.Save)
-            if append_button:
-                append_button.clicked.connect(lambda: mode_holder.update(mode="a"))
-            replace_button = button_box.addButton(
-                "Replace",
-                QDialogButtonBox.ButtonRole.AcceptRole,
-            )
-            replace_button.clicked.connect(lambda: mode_holder.update(mode="w"))
+        dialog = self._get_log_dialog()
+        self._log_mode = "a"
         if dialog.exec() != QDialog.DialogCode.Accepted:
             return
         files = dialog.selectedFiles()
         if not files:
             return
         path = files[0]
-        self._file_logger.start(Path(path), mode=mode_holder["mode"])
+        self._file_logger.start(Path(path), mode=self._log_mode)
+        self._logger_active = True
         self._log_path = Path(path)
-        self._settings.setValue("logging/last_path", path)
-        self._action_log_start.setEnabled(False)
-        self._action_log_stop.setEnabled(True)
+        self._last_log_path = path
+        self._save_timer.start()
         self._update_log_status()
 
     def _stop_logging(self) -> None:
         self._file_logger.stop()
-        self._action_log_start.setEnabled(True)
-        self._action_log_stop.setEnabled(False)
-        self._status_log_label.setText("Logging stopped")
+        self._logger_active = False
+        self._log_status_timer.stop()
+        self._set_log_text("Logging stopped")
         self._log_path = None
 
     def _save_command_history(self) -> None:
@@ -742,6 +1017,8 @@ class MainWindow(QMainWindow):
         if not history:
             QMessageBox.information(self, "Command History", "No command history to save.")
             return
+        from PySide6.QtWidgets import QFileDialog
+
         path, _ = QFileDialog.getSaveFileName(
             self,
             "Save command history",
@@ -756,34 +1033,31 @@ class MainWindow(QMainWindow):
                 f.write(entry + "\n")
 
     def _update_log_status(self) -> None:
-        if not self._file_logger.is_active() or not self._log_path:
+        if not self._logger_active or not self._log_path:
             return
         size = self._file_logger.size_bytes()
-        self._status_log_label.setText(
-            f"Logging to {self._log_path} ({self._format_bytes(size)})"
-        )
+        self._set_log_text(f"Logging to {self._log_path} ({self._format_bytes(size)})")
 
     @staticmethod
     def _format_bytes(size: int) -> str:
-        for unit in ("B", "KB", "MB", "GB", "TB"):
-            if size < 1024:
-                return f"{size:.0f} {unit}"
-            size /= 1024
-        return f"{size:.0f} PB"
+        # Each unit is 2**10 of the previous one, so the bit length picks it
+        unit = min(max(0, (size.bit_length() - 1) // 10), len(_BYTE_UNITS) - 1)
+        return f"{size / (1 << (unit * 10)):.0f} {_BYTE_UNITS[unit]}"
 
     def _open_variables_dialog(self) -> None:
         """Open the unified Variables dialog."""
+        from .ui.variable_dialog import VariablesDialog
+
         dialog = VariablesDialog(
             self._variable_manager.variables,
             self._variable_manager.serial_config,
-            get_values=lambda: self._variable_manager.get_values(),
+            get_values=self._variable_manager.get_values,
             values_updated_signal=self._variable_manager.values_updated,
             parent=self,
         )
         if dialog.exec() == QDialog.DialogCode.Accepted:
+            # variables_changed brings the MQTT monitor table up to date
             self._variable_manager.set_variables(dialog.variables())
-            # Refresh MQTT monitor table to stay in sync
-            self._mqtt_monitor_widget.refresh_from_manager()
 
     def _clear_plot(self) -> None:
         if not self._dashboard_window or not self._dashboard_window.has_active_plot():
@@ -792,8 +1066,7 @@ class MainWindow(QMainWindow):
         self._dashboard_window.clear_active_plot()
 
     def _add_plot(self) -> None:
-        if self._dashboard_window:
-            self._dashboard_window.add_plot()
+        self._get_dashboard().add_plot()
 
     def _remove_plot(self) -> None:
         if not self._dashboard_window or not self._dashboard_window.has_active_plot():
@@ -837,47 +1110,79 @@ class MainWindow(QMainWindow):
         self._console.set_scroll_locked(is_locked)
 
     def _save_settings(self) -> None:
-        self._serial_settings.to_qsettings(self._settings)
-        self._appearance_settings.to_qsettings(self._settings)
-        self._mqtt_settings.to_qsettings(self._settings)
-        self._plot_config.to_qsettings(self._settings)
+        self._save_timer.stop()
+        settings = self._settings
+        for config in (
+            self._serial_settings,
+            self._appearance_settings,
+            self._mqtt_settings,
+            self._plot_config,
+        ):
+            if self._saved_configs.get(type(config)) != config:
+                config.to_qsettings(settings)
+                self._saved_configs[type(config)] = deepcopy(config)
         self._variable_manager.save()
-        self._input_line.save_to_settings(self._settings)
-        self._settings.setValue(SK.WINDOW_GEOMETRY, self.saveGeometry())
-        self._settings.setValue(SK.WINDOW_STATE, self.saveState())
-        self._settings.setValue("view/tab", self._tabs.currentIndex())
-        self._settings.setValue("view/splitter", self._main_splitter.saveState())
+        self._input_line.save_to_settings(settings)
+        self._serial_plot_panel.save_to_settings(settings)
+        settings.setValue(SK.LOGGING_LAST_PATH, self._last_log_path)
+        settings.setValue(SK.COMMANDS_LAST_PATH, self._last_preset_path)
+        settings.beginGroup(SK.WINDOW_GROUP)
+        if self._geometry_changed:
+            settings.setValue(SK.WINDOW_GEOMETRY, self.saveGeometry())
+            self._geometry_changed = False
+        settings.setValue(SK.WINDOW_STATE, self.saveState())
+        settings.endGroup()
+        settings.beginGroup(SK.VIEW_GROUP)
+        settings.setValue(SK.VIEW_TAB, self._tabs.currentIndex())
+        settings.setValue(SK.VIEW_SPLITTER, self._main_splitter.saveState())
+        settings.endGroup()
         if self._dashboard_window:
             self._dashboard_window.save_state()
+        settings.sync()
+
+    def _saved_blob(self, key: str) -> QByteArray | None:
+        """Return a stored geometry/state blob (relative to the current group), or None."""
+        blob = self._settings.value(key)
+        if isinstance(blob, QByteArray) and not blob.isEmpty():
+            return blob
+        return None
 
     def _restore_window_state(self) -> None:
-        geometry = self._settings.value(SK.WINDOW_GEOMETRY)
-        if geometry:
+        settings = self._settings
+        settings.beginGroup(SK.WINDOW_GROUP)
+        geometry = self._saved_blob(SK.WINDOW_GEOMETRY)
+        state = self._saved_blob(SK.WINDOW_STATE)
+        settings.endGroup()
+        settings.beginGroup(SK.VIEW_GROUP)
+        tab_index = settings.value(SK.VIEW_TAB)
+        splitter_state = self._saved_blob(SK.VIEW_SPLITTER)
+        settings.endGroup()
+
+        if geometry is not None:
             self.restoreGeometry(geometry)
-        state = self._settings.value(SK.WINDOW_STATE)
-        if state:
+        if state is not None:
             self.restoreState(state)
-        tab_index = self._settings.value("view/tab")
         if tab_index is not None:
             try:
                 self._tabs.setCurrentIndex(int(tab_index))
             except (TypeError, ValueError):
                 pass
-        splitter_state = self._settings.value("view/splitter")
-        if splitter_state:
+        if splitter_state is not None:
             self._main_splitter.restoreState(splitter_state)
         if self._dashboard_window:
             self._dashboard_window.restore_state()
 
 
     def _store_last_preset_path(self, path: str) -> None:
-        self._settings.setValue(SK.COMMANDS_LAST_PATH, path)
+        if path != self._last_preset_path:
+            self._last_preset_path = path
+            self._save_timer.start()
 
     def _restore_last_preset(self) -> None:
-        path = self._settings.value(SK.COMMANDS_LAST_PATH, "", str)
+        path = self._last_preset_path
         if path:
             try:
                 self._command_toolbar.load_preset_from_path(path)
             except Exception:
                 logger.warning("Failed to restore preset from %s", path, exc_info=True)
-                self._settings.remove(SK.COMMANDS_LAST_PATH)
+                self._store_last_preset_path("")
@@ -2,12 +2,13 @@ from __future__ import annotations
 
 import logging
 import ssl
+from collections import deque
 from typing import TYPE_CHECKING
 
 logger = logging.getLogger(__name__)
 
 import paho.mqtt.client as mqtt
-from PySide6.QtCore import QObject, Signal
+from PySide6.QtCore import QMetaMethod, QObject, QTimer, Signal, Slot
 
 from .settings import MQTTSettings
 
@@ -26,6 +27,11 @@ _CONNACK_REASONS = {
     135: "Not authorized (broker rejected credentials or ACL)",
 }
 
+# Incoming messages are queued by the network thread and handed to the GUI
+# thread in batches at this interval; the oldest are dropped past the cap.
+_FLUSH_INTERVAL_MS = 20
+_INBOX_MAX = 10_000
+
 
 def _connack_message(rc: int) -> str:
     msg = _CONNACK_REASONS.get(rc)
@@ -33,6 +39,9 @@ def _connack_message(rc: int) -> str:
 
 
 class MQTTManager(QObject):
+    # list of (topic, payload) tuples, in arrival order
+    messages_batch = Signal(list)
+    # Per-message signal, still emitted for listeners that connect to it
     message_received = Signal(str, bytes)
     connection_changed = Signal(bool)
     error = Signal(str)
@@ -42,6 +51,12 @@ class MQTTManager(QObject):
         self._client: mqtt.Client | None = None
         self._settings: MQTTSettings | None = None
         self._connected = False
+        # deque.append/popleft are thread-safe, so paho's thread needs no lock
+        self._inbox: deque[tuple[str, bytes]] = deque(maxlen=_INBOX_MAX)
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setInterval(_FLUSH_INTERVAL_MS)
+        self._flush_timer.timeout.connect(self._flush_inbox)
+        self._message_received_method = QMetaMethod.fromSignal(self.message_received)
 
     def is_connected(self) -> bool:
         return self._connected
@@ -90,7 +105,9 @@ class MQTTManager(QObject):
             self._client = None
             return False
 
+        self._inbox.clear()
         self._client.loop_start()
+        self._flush_timer.start()
         return True
 
     def disconnect_(self) -> None:
@@ -100,6 +117,8 @@ class MQTTManager(QObject):
         self._client.disconnect()
         self._client = None
         self._connected = False
+        self._flush_timer.stop()
+        self._inbox.clear()
         self.connection_changed.emit(False)
 
     def subscribe(self, topic: str) -> None:
@@ -151,4 +170,16 @@ class MQTTManager(QObject):
         userdata: None,
         message: mqtt.MQTTMessage,
     ) -> None:
-        self.message_received.emit(message.topic, message.payload)
+        # Runs on paho's network thread: queue only, _flush_inbox emits.
+        self._inbox.append((message.topic, message.payload))
+
+    @Slot()
+    def _flush_inbox(self) -> None:
+        inbox = self._inbox
+        if not inbox:
+            return
+        batch = [inbox.popleft() for _ in range(len(inbox))]
+        self.messages_batch.emit(batch)
+        if self.isSignalConnected(self._message_received_method):
+            for topic, payload in batch:
+                self.message_received.emit(topic, payload)
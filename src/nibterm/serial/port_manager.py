@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import logging
 
-from PySide6.QtCore import QObject, QTimer, Signal, Slot
+from PySide6.QtCore import QByteArray, QObject, QTimer, Signal, Slot
 from PySide6.QtSerialPort import QSerialPort
 
 logger = logging.getLogger(__name__)
@@ -11,7 +11,7 @@ from .settings import SerialSettings
 
 
 class PortManager(QObject):
-    data_received = Signal(bytes)
+    data_received = Signal(QByteArray)
     connection_changed = Signal(bool)
     error = Signal(str)
     reconnecting = Signal(bool)
@@ -32,6 +32,9 @@ class PortManager(QObject):
     def is_open(self) -> bool:
         return self._serial.isOpen()
 
+    def error_string(self) -> str:
+        return self._serial.errorString()
+
     def set_auto_reconnect(self, enabled: bool) -> None:
         self._auto_reconnect = enabled
         if not enabled:
@@ -91,7 +94,7 @@ class PortManager(QObject):
         data = self._serial.readAll()
         logger.debug("readyRead: %d bytes", len(data))
         if not data.isEmpty():
-            self.data_received.emit(bytes(data))
+            self.data_received.emit(data)
 
     @Slot(QSerialPort.SerialPortError)
     def _handle_error(self, error: QSerialPort.SerialPortError) -> None:
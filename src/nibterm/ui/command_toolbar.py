@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from functools import partial
 from pathlib import Path
 
 from PySide6.QtCore import QSettings, Qt, Signal, QSize
@@ -26,13 +27,13 @@ class CommandToolbar(QToolBar):
     command_requested = Signal(str)
     preset_loaded = Signal(str)
 
-    def __init__(self, parent=None) -> None:
+    def __init__(self, parent=None, settings: QSettings | None = None) -> None:
         super().__init__("Commands", parent)
         self.setOrientation(Qt.Orientation.Vertical)
         self.setMovable(False)
         self.setToolButtonStyle(Qt.ToolButtonStyle.ToolButtonTextOnly)
 
-        self._settings = QSettings()
+        self._settings = settings if settings is not None else QSettings()
         self._preset: CommandPreset | None = None
         self._command_actions: list[QAction] = []
         self._param_inputs: dict[str, dict[str, QLineEdit]] = {}
@@ -177,9 +178,7 @@ class CommandToolbar(QToolBar):
                     entry.setText(stored)
                 elif param.default:
                     entry.setText(param.default)
-                entry.textChanged.connect(
-                    lambda value, k=key: self._settings.setValue(k, value)
-                )
+                entry.textChanged.connect(partial(self._settings.setValue, key))
                 entry.textChanged.connect(
                     lambda _value, label=command.label: self._update_param_summary(label)
                 )
@@ -230,9 +229,7 @@ class CommandToolbar(QToolBar):
                         entry.setText(stored_val)
                     elif isinstance(opt.default, str):
                         entry.setText(opt.default)
-                    entry.textChanged.connect(
-                        lambda value, k=value_key: self._settings.setValue(k, value)
-                    )
+                    entry.textChanged.connect(partial(self._settings.setValue, value_key))
                     entry.textChanged.connect(
                         lambda _value, lbl=command.label: self._update_param_summary(lbl)
                     )
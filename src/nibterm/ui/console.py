@@ -6,6 +6,8 @@ from PySide6.QtWidgets import QPlainTextEdit
 
 from ..config import defaults
 
+_ECHO_PREFIX = "> "
+
 
 class ConsoleWidget(QPlainTextEdit):
     line_count_changed = Signal(int, int)
@@ -20,6 +22,8 @@ class ConsoleWidget(QPlainTextEdit):
         self._line_buffer = ""
         self._display_at_line_start = True  # for timestamp at start of each line
         self._default_text_color = QColor("black")
+        self._echo_format = QTextCharFormat()
+        self._echo_format.setForeground(QColor(defaults.DEFAULT_CONSOLE_ECHO_COLOR))
         self._scroll_locked = False
         self._programmatic_scroll = False
         self.verticalScrollBar().valueChanged.connect(self._on_scrollbar_moved)
@@ -57,18 +61,43 @@ class ConsoleWidget(QPlainTextEdit):
         self.setPalette(palette)
 
     def append_data(self, text: str, prefix_timestamp: bool) -> list[str]:
+        """Display *text* and return the lines it completed (without line endings)."""
         if not text:
             return []
 
         self._line_buffer += text
         lines = self._line_buffer.splitlines(keepends=True)
-
-        completed_lines: list[str] = []
         if lines and not lines[-1].endswith(("\n", "\r")):
             self._line_buffer = lines.pop()
         else:
             self._line_buffer = ""
 
+        self._display_data(text, prefix_timestamp)
+        return [line.rstrip("\r\n") for line in lines]
+
+    def append_data_last_line(self, text: str, prefix_timestamp: bool) -> str | None:
+        """Display *text* and return only the last line it completed, or None.
+
+        For callers that have no use for the full line list: the pending
+        partial line is tracked the same way, without splitting the chunk.
+        """
+        if not text:
+            return None
+
+        buffer = self._line_buffer + text
+        end = max(buffer.rfind("\n"), buffer.rfind("\r"))
+        self._display_data(text, prefix_timestamp)
+        if end < 0:
+            self._line_buffer = buffer
+            return None
+        self._line_buffer = buffer[end + 1:]
+        # Drop the final line ending ("\r\n" counts as one), then keep
+        # whatever follows the line ending before it.
+        stop = end - 1 if end and buffer.startswith("\r\n", end - 1) else end
+        start = max(buffer.rfind("\n", 0, stop), buffer.rfind("\r", 0, stop)) + 1
+        return buffer[start:stop]
+
+    def _display_data(self, text: str, prefix_timestamp: bool) -> None:
         # Save scroll position before modifying content when locked.
         saved_scroll = self.verticalScrollBar().value() if self._scroll_locked else None
 
@@ -104,30 +133,34 @@ class ConsoleWidget(QPlainTextEdit):
         else:
             self.setTextCursor(cursor)
 
-        for line in lines:
-            completed_lines.append(line.rstrip("\r\n"))
-
-        if text or completed_lines:
-            self._scroll_to_bottom()
-            self._emit_line_count()
-        return completed_lines
+        self._scroll_to_bottom()
+        self._emit_line_count()
 
     def append_text(self, text: str) -> None:
         self.append_text_colored(text, None)
 
     def append_text_colored(self, text: str, color: str | None) -> None:
+        fmt = None
+        if color is not None:
+            fmt = QTextCharFormat()
+            fmt.setForeground(QColor(color))
+        self._append_block(text, fmt)
+
+    def append_echo(self, text: str) -> None:
+        """Append a locally echoed command ("> text") in the echo colour."""
+        self._append_block(_ECHO_PREFIX + text, self._echo_format)
+
+    def _append_block(self, text: str, fmt: QTextCharFormat | None) -> None:
         if not text:
             return
         saved_scroll = self.verticalScrollBar().value() if self._scroll_locked else None
         cursor = self.textCursor()
         cursor.movePosition(QTextCursor.MoveOperation.End)
-        if color is not None:
-            fmt = QTextCharFormat()
-            fmt.setForeground(QColor(color))
+        if fmt is not None:
             cursor.setCharFormat(fmt)
         cursor.insertText(text)
         cursor.insertBlock()
-        if color is not None:
+        if fmt is not None:
             cursor.setCharFormat(QTextCharFormat())
         if saved_scroll is not None:
             self._programmatic_scroll = True
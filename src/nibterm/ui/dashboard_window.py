@@ -127,6 +127,19 @@ class DashboardWindow(QWidget):
             if config:
                 self._update_plot_title(plot, config)
 
+    def handle_values_batch(
+        self, batch: list[tuple[dict[str, float], set[str] | None]]
+    ) -> None:
+        """Push several ``(values, updated_names)`` samples, e.g. one per serial line.
+
+        Each plot's window title is refreshed once per batch rather than per sample.
+        """
+        for plot in self._plot_panels:
+            plot.handle_values_batch(batch)
+            config = self._plot_configs.get(plot)
+            if config:
+                self._update_plot_title(plot, config)
+
     def clear_plots(self) -> None:
         for plot in self._plot_panels:
             plot.clear()
@@ -31,8 +31,9 @@ class FirmwareWidget(QWidget):
     port_release_requested = Signal(str)
     upload_complete = Signal()
 
-    def __init__(self, parent=None) -> None:
+    def __init__(self, parent=None, settings: QSettings | None = None) -> None:
         super().__init__(parent)
+        self._settings = settings if settings is not None else QSettings()
         self._config: FirmwareConfig | None = None
         self._firmware_files: list[FirmwareFile] = []
         self._runner = UploadRunner(self)
@@ -163,7 +164,7 @@ class FirmwareWidget(QWidget):
         self._device_combo.blockSignals(False)
 
         # Restore last selected device
-        settings = QSettings()
+        settings = self._settings
         last_dev = settings.value(SK.FIRMWARE_LAST_DEVICE, "")
         if last_dev:
             idx = self._device_combo.findData(last_dev)
@@ -190,8 +191,7 @@ class FirmwareWidget(QWidget):
 
     def restore_last_config(self) -> None:
         """Called by MainWindow on startup to restore last used config."""
-        settings = QSettings()
-        path = settings.value(SK.FIRMWARE_CONFIG_PATH, "")
+        path = self._settings.value(SK.FIRMWARE_CONFIG_PATH, "")
         if path and Path(path).is_file():
             self._load_config(path)
 
@@ -213,8 +213,7 @@ class FirmwareWidget(QWidget):
             display = f"v{fw.version}" if fw.version != "unknown" else fw.filename
             self._firmware_combo.addItem(f"{display}  ({fw.filename})")
 
-        settings = QSettings()
-        settings.setValue(SK.FIRMWARE_LAST_DEVICE, dev.name)
+        self._settings.setValue(SK.FIRMWARE_LAST_DEVICE, dev.name)
 
     def _current_device(self) -> Device | None:
         if not self._config:
@@ -260,7 +259,7 @@ class FirmwareWidget(QWidget):
             self._append_error("No port specified.")
             return
 
-        QSettings().setValue(SK.FIRMWARE_LAST_PORT, port)
+        self._settings.setValue(SK.FIRMWARE_LAST_PORT, port)
 
         self._pending_upload = True
         self.port_release_requested.emit(port)
@@ -10,7 +10,7 @@ from typing import Callable
 logger = logging.getLogger(__name__)
 
 from PySide6.QtCore import QEvent, QPoint, Qt, Signal, Slot
-from PySide6.QtGui import QColor, QMouseEvent, QTextCharFormat, QTextCursor
+from PySide6.QtGui import QColor, QMouseEvent, QShowEvent, QTextCharFormat, QTextCursor
 from PySide6.QtWidgets import (
     QComboBox,
     QHBoxLayout,
@@ -63,6 +63,7 @@ class MQTTMonitorWidget(QWidget):
         self._message_time_by_topic: dict[str, float] = {}
         self._displayed_topic: str = ""
         self._displayed_topic_for_parser: str = ""
+        self._table_stale = False  # variables changed while the tab was hidden
 
         self._topic_filter = QLineEdit()
         self._topic_filter.setPlaceholderText("Filter topics…")
@@ -164,7 +165,12 @@ class MQTTMonitorWidget(QWidget):
         self._refresh_table_from_manager()
 
         # Listen for external changes (e.g. Variables dialog)
-        self._variable_manager.variables_changed.connect(self._refresh_table_from_manager)
+        self._variable_manager.variables_changed.connect(self._on_variables_changed)
+
+    def showEvent(self, event: QShowEvent) -> None:
+        super().showEvent(event)
+        if self._table_stale:
+            self._refresh_table_from_manager()
 
     def refresh_from_manager(self) -> None:
         """Public method -- called by MainWindow after Variables dialog changes."""
@@ -189,8 +195,17 @@ class MQTTMonitorWidget(QWidget):
             return "(regex — not yet configured)"
         return ""
 
+    @Slot()
+    def _on_variables_changed(self) -> None:
+        # A hidden tab catches up in showEvent instead of rebuilding the table now
+        if self.isVisible():
+            self._refresh_table_from_manager()
+        else:
+            self._table_stale = True
+
     def _refresh_table_from_manager(self) -> None:
         """Populate the MQTT quick-add table from the VariableManager's MQTT variables."""
+        self._table_stale = False
         self._plot_table.blockSignals(True)
         try:
             mqtt_vars = self._variable_manager.get_mqtt_variables()
@@ -270,17 +285,18 @@ class MQTTMonitorWidget(QWidget):
 
         # Ensure unique names across all variables
         used_names: set[str] = {v.name for v in non_mqtt}
+        next_suffix: dict[str, int] = {}
         for v in new_mqtt_vars:
-            v.name = unique_variable_name(v.name, used_names)
+            v.name = unique_variable_name(v.name, used_names, next_suffix)
             used_names.add(v.name)
 
         all_vars = non_mqtt + new_mqtt_vars
         # Block the signal to avoid re-entry
-        self._variable_manager.variables_changed.disconnect(self._refresh_table_from_manager)
+        self._variable_manager.variables_changed.disconnect(self._on_variables_changed)
         try:
             self._variable_manager.set_variables(all_vars)
         finally:
-            self._variable_manager.variables_changed.connect(self._refresh_table_from_manager)
+            self._variable_manager.variables_changed.connect(self._on_variables_changed)
 
         # Refresh table to reflect name deduplication etc.
         self._refresh_table_from_manager()
@@ -666,7 +682,9 @@ class MQTTMonitorWidget(QWidget):
             if v.mqtt_topic != topic:
                 continue
             if cfg.mode == "csv":
-                column_values = parse_csv_line(text, cfg.csv_delimiter, column_indices=None)
+                column_values = parse_csv_line(
+                    text, cfg.csv_delimiter, column_indices=[v.csv_column]
+                )
                 if v.csv_column in column_values:
                     values_by_name[v.name] = column_values[v.csv_column]
             elif cfg.mode == "json":
@@ -1,10 +1,10 @@
 from __future__ import annotations
 
 import logging
-from collections import deque
 from datetime import datetime
 from typing import Callable
 
+import numpy as np
 import pyqtgraph as pg
 from PySide6.QtCore import QTimer
 from PySide6.QtWidgets import QVBoxLayout, QWidget
@@ -14,12 +14,57 @@ from ..config.plot_config import PlotConfig
 logger = logging.getLogger(__name__)
 
 
+class _SeriesBuffer:
+    """Ring buffer of the last *capacity* points, stored as x and y columns."""
+
+    __slots__ = ("_xy", "_next", "_count")
+
+    def __init__(self, capacity: int) -> None:
+        self._xy = np.empty((2, capacity), dtype=np.float64)
+        self._next = 0
+        self._count = 0
+
+    def __len__(self) -> int:
+        return self._count
+
+    def append(self, x_value: float, y_value: float) -> None:
+        xy = self._xy
+        i = self._next
+        xy[0, i] = x_value
+        xy[1, i] = y_value
+        capacity = xy.shape[1]
+        self._next = (i + 1) % capacity
+        if self._count < capacity:
+            self._count += 1
+
+    def arrays(self) -> tuple[np.ndarray, np.ndarray]:
+        """Return fresh ``(x, y)`` arrays, oldest point first."""
+        xy = self._xy
+        if self._count < xy.shape[1]:
+            ordered = xy[:, : self._count].copy()
+        else:
+            ordered = np.roll(xy, -self._next, axis=1)
+        return ordered[0], ordered[1]
+
+    def resized(self, capacity: int) -> _SeriesBuffer:
+        """Return a new buffer of *capacity* holding the most recent points."""
+        buf = _SeriesBuffer(capacity)
+        x_values, y_values = self.arrays()
+        keep = min(capacity, len(x_values))
+        if keep:
+            buf._xy[0, :keep] = x_values[-keep:]
+            buf._xy[1, :keep] = y_values[-keep:]
+        buf._count = keep
+        buf._next = keep % capacity
+        return buf
+
+
 class PlotPanel(QWidget):
     def __init__(self, parent=None) -> None:
         super().__init__(parent)
         self._config = PlotConfig()
         self._enabled = False
-        self._series: dict[str, deque[tuple[float, float]]] = {}
+        self._series: dict[str, _SeriesBuffer] = {}
         self._curves: dict[str, pg.PlotDataItem] = {}
         self._sample_index = 0
         self._start_time: float | None = None
@@ -98,10 +143,7 @@ class PlotPanel(QWidget):
         if new_size <= 0:
             return
         self._buffer_size = new_size
-        resized: dict[str, deque[tuple[float, float]]] = {}
-        for name, data in self._series.items():
-            resized[name] = deque(data, maxlen=new_size)
-        self._series = resized
+        self._series = {name: data.resized(new_size) for name, data in self._series.items()}
 
     # -- new values-based entry point -----------------------------------------
 
@@ -122,6 +164,17 @@ class PlotPanel(QWidget):
         else:
             self._handle_timeseries(values, updated_names)
 
+    def handle_values_batch(
+        self, batch: list[tuple[dict[str, float], set[str] | None]]
+    ) -> None:
+        """Like :meth:`handle_values` for several samples, checking the mode once."""
+        if not self._enabled:
+            return
+        handle = self._handle_xy if self._config.mode == "xy" else self._handle_timeseries
+        for values, updated_names in batch:
+            if values:
+                handle(values, updated_names)
+
     def _handle_timeseries(
         self,
         values: dict[str, float],
@@ -161,9 +214,10 @@ class PlotPanel(QWidget):
         self._append_point(y_key, x_value, y_value)
 
     def _append_point(self, name: str, x_value: float, y_value: float) -> None:
-        if name not in self._series:
-            self._series[name] = deque(maxlen=self._config.buffer_size)
-        self._series[name].append((x_value, y_value))
+        series = self._series.get(name)
+        if series is None:
+            series = self._series[name] = _SeriesBuffer(self._config.buffer_size)
+        series.append(x_value, y_value)
 
     def _refresh_plot(self) -> None:
         if not self._enabled:
@@ -193,8 +247,7 @@ class PlotPanel(QWidget):
                         pen=pg.mkPen(color=color, width=2),
                         name=display_name,
                     )
-            x_values = [p[0] for p in points]
-            y_values = [p[1] for p in points]
+            x_values, y_values = points.arrays()
             if self._config.mode == "xy":
                 self._curves[name].setData(
                     x_values,
@@ -35,7 +35,12 @@ _SETTINGS_KEY_EXPANDED = "ui/serial_plot_panel_expanded"
 class SerialPlotPanel(QWidget):
     """Collapsible panel below the terminal: last serial line (clickable when CSV) and serial variables table."""
 
-    def __init__(self, variable_manager: "VariableManager", parent: QWidget | None = None) -> None:
+    def __init__(
+        self,
+        variable_manager: "VariableManager",
+        parent: QWidget | None = None,
+        settings: QSettings | None = None,
+    ) -> None:
         super().__init__(parent)
         self._variable_manager = variable_manager
         self._content_widget: QWidget | None = None
@@ -53,7 +58,9 @@ class SerialPlotPanel(QWidget):
         self._toggle_btn.setStyleSheet("text-align: left; padding-left: 6px;")
         self._toggle_btn.setCheckable(True)
         self._toggle_btn.setChecked(False)
-        expanded = QSettings().value(_SETTINGS_KEY_EXPANDED, False, type=bool)
+        if settings is None:
+            settings = QSettings()
+        expanded = settings.value(_SETTINGS_KEY_EXPANDED, False, type=bool)
         self._toggle_btn.setChecked(expanded)
         self._toggle_btn.clicked.connect(self._on_toggle_clicked)
         layout.addWidget(self._toggle_btn)
@@ -123,7 +130,11 @@ class SerialPlotPanel(QWidget):
         if self._content_widget is not None:
             self._content_widget.setVisible(expanded)
         self._update_toggle_text()
-        QSettings().setValue(_SETTINGS_KEY_EXPANDED, expanded)
+
+    def save_to_settings(self, settings: QSettings) -> None:
+        """Persist the expanded state (written with the window's other settings)."""
+        expanded = self._toggle_btn.isChecked() if self._toggle_btn else False
+        settings.setValue(_SETTINGS_KEY_EXPANDED, expanded)
 
     def _refresh_last_line(self) -> None:
         if self._last_line_display is None or self._last_line_label is None:
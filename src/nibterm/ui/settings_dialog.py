@@ -29,9 +29,10 @@ from ..serial.settings import AppearanceSettings, SerialSettings
 class SettingsDialog(QDialog):
     settings_applied = Signal(SerialSettings, AppearanceSettings)
 
-    def __init__(self, parent=None) -> None:
+    def __init__(self, parent=None, settings: QSettings | None = None) -> None:
         super().__init__(parent)
         self.setWindowTitle("Settings")
+        self._qsettings = settings if settings is not None else QSettings()
 
         self._serial_settings = SerialSettings()
         self._appearance_settings = AppearanceSettings()
@@ -261,7 +262,7 @@ class SettingsDialog(QDialog):
         self._font_size.setValue(appearance.font_size)
         self._update_color_previews()
 
-        qs = QSettings()
+        qs = self._qsettings
         self._buffer_size_spin.setValue(
             qs.value(SK.CONSOLE_MAX_BLOCK_COUNT, defaults.DEFAULT_CONSOLE_MAX_BLOCK_COUNT, int)
         )
@@ -306,7 +307,7 @@ class SettingsDialog(QDialog):
             background_color=self._appearance_settings.background_color,
             text_color=self._appearance_settings.text_color,
         )
-        qs = QSettings()
+        qs = self._qsettings
         qs.setValue(SK.CONSOLE_MAX_BLOCK_COUNT, self._buffer_size_spin.value())
         qs.setValue(SK.HISTORY_MAX_LENGTH, self._history_max_spin.value())
 
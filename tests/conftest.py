@@ -0,0 +1,31 @@
+"""Shared pytest fixtures."""
+from __future__ import annotations
+
+import os
+from collections.abc import Callable
+
+import pytest
+from PySide6.QtCore import QSettings
+from PySide6.QtWidgets import QApplication
+
+
+@pytest.fixture
+def qapp() -> QApplication:
+    """The process-wide QApplication, created offscreen on first use."""
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    return QApplication.instance() or QApplication([])
+
+
+@pytest.fixture
+def make_settings(tmp_path) -> Callable[..., QSettings]:
+    """Factory for settings objects backed by one ini file in *tmp_path*.
+
+    Every call opens a new instance on the same file; pass a ``QSettings``
+    subclass to get one of those instead.
+    """
+    path = str(tmp_path / "settings.ini")
+
+    def make(cls: type[QSettings] = QSettings) -> QSettings:
+        return cls(path, QSettings.Format.IniFormat)
+
+    return make
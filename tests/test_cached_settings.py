@@ -0,0 +1,81 @@
+"""Tests for nibterm.config.cached_settings."""
+from __future__ import annotations
+
+from pathlib import Path
+
+from nibterm.config.cached_settings import CachedSettings, SettingsWriter
+
+
+class TestCachedSettings:
+    def test_reads_are_cached(self, make_settings) -> None:
+        settings = make_settings(CachedSettings)
+        settings.setValue("a/b", 5)
+        assert settings.value("a/b", 0, int) == 5
+        assert settings.value("missing", "dflt", str) == "dflt"
+
+        other = make_settings()
+        other.setValue("a/b", 7)
+        assert settings.value("a/b", 0, int) == 5
+        settings.invalidate("a/b")
+        assert settings.value("a/b", 0, int) == 7
+
+    def test_groups_and_arrays(self, make_settings) -> None:
+        settings = make_settings(CachedSettings)
+        settings.beginWriteArray("items")
+        for i, name in enumerate(("x", "y")):
+            settings.setArrayIndex(i)
+            settings.setValue("name", name)
+        settings.endArray()
+
+        size = settings.beginReadArray("items")
+        names = []
+        for i in range(size):
+            settings.setArrayIndex(i)
+            names.append(settings.value("name", "", str))
+        settings.endArray()
+        assert names == ["x", "y"]
+
+        settings.remove("items")
+        assert settings.value("items/0/name", "", str) == ""
+
+    def test_unchanged_write_is_skipped(self, make_settings) -> None:
+        settings = make_settings(CachedSettings)
+        settings.setValue("k", "v")
+        other = make_settings()
+        other.setValue("k", "changed")
+        settings.setValue("k", "v")
+        assert other.value("k") == "changed"
+        settings.setValue("k", "w")
+        assert other.value("k") == "w"
+
+    def test_mutated_container_is_written_again(self, make_settings) -> None:
+        settings = make_settings(CachedSettings)
+        history = ["one"]
+        settings.setValue("history", history)
+        history.append("two")
+        settings.setValue("history", history)
+        other = make_settings()
+        assert other.value("history") == ["one", "two"]
+
+        loaded = settings.value("history", [], list)
+        loaded.append("three")
+        settings.setValue("history", loaded)
+        assert other.value("history") == ["one", "two", "three"]
+
+    def test_sync_only_when_dirty(self, make_settings) -> None:
+        settings = make_settings(CachedSettings)
+        assert not settings._dirty
+        settings.setValue("k", "v")
+        assert settings._dirty
+        settings.sync()
+        assert not settings._dirty
+        settings.setValue("k", "v")
+        assert not settings._dirty
+        assert "k=v" in Path(settings.fileName()).read_text()
+
+    def test_writer_flushes_shared_store(self, make_settings) -> None:
+        settings = make_settings(CachedSettings)
+        settings.setValue("k", "v")
+        # The writer's own QSettings instance sees and flushes the pending write.
+        SettingsWriter(settings.fileName(), settings.format()).sync()
+        assert "k=v" in Path(settings.fileName()).read_text()
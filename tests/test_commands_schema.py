@@ -0,0 +1,50 @@
+"""Tests for nibterm.config.commands_schema."""
+from __future__ import annotations
+
+import os
+
+import pytest
+
+from nibterm.config.commands_schema import load_preset
+
+_PRESET = """\
+name: demo
+commands:
+  - label: Reset
+    command: "reset\\n"
+  - label: Set rate
+    command: "rate {hz}\\n"
+    params:
+      - name: hz
+        default: 10
+    options:
+      - flag: "-v"
+"""
+
+
+class TestLoadPreset:
+    def test_basic(self, tmp_path) -> None:
+        path = tmp_path / "preset.yaml"
+        path.write_text(_PRESET, encoding="utf-8")
+        preset = load_preset(path)
+        assert preset.name == "demo"
+        assert [c.label for c in preset.commands] == ["Reset", "Set rate"]
+        assert preset.commands[1].params[0].default == "10"
+        assert preset.commands[1].options[0].type == "bool"
+
+    def test_cached_until_modified(self, tmp_path) -> None:
+        path = tmp_path / "preset.yaml"
+        path.write_text(_PRESET, encoding="utf-8")
+        first = load_preset(path)
+        assert load_preset(str(path)) is first
+
+        path.write_text(_PRESET.replace("demo", "other"), encoding="utf-8")
+        st = path.stat()
+        os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+        assert load_preset(path).name == "other"
+
+    def test_missing_name(self, tmp_path) -> None:
+        path = tmp_path / "preset.yaml"
+        path.write_text("commands: []\n", encoding="utf-8")
+        with pytest.raises(ValueError, match="name"):
+            load_preset(path)
@@ -1,10 +1,17 @@
-"""Tests for nibterm.config.plot_config serialization helpers."""
+"""Tests for nibterm.config serialization helpers."""
 from __future__ import annotations
 
+from nibterm.config import settings_keys as SK
 from nibterm.config.plot_config import (
+    from_qsettings,
     parse_string_list,
     serialize_string_list,
 )
+from nibterm.config.variable import (
+    VariableDefinition,
+    load_variables,
+    save_variables,
+)
 
 
 class TestStringList:
@@ -18,3 +25,55 @@ class TestStringList:
 
     def test_empty_entries_filtered(self) -> None:
         assert serialize_string_list(["a", "", "b"]) == "a; b"
+
+
+class TestPlotConfigPersistence:
+    def test_invalid_values_read_as_default(self, make_settings) -> None:
+        settings = make_settings()
+        settings.setValue(SK.PLOT_SERIES_VARS, None)
+        settings.setValue(SK.PLOT_XY_X_VAR, None)
+        settings.sync()
+        config = from_qsettings(make_settings())
+        assert config.series_variables == []
+        assert config.xy_x_var == ""
+
+
+class TestVariablesPersistence:
+    def test_round_trip(self, make_settings) -> None:
+        variables = [
+            VariableDefinition(name="temp", source="serial", csv_column=2, unit="C"),
+            VariableDefinition(name="hum", source="mqtt", mqtt_topic="room/1", json_path="$.h"),
+            VariableDefinition(name="dew", source="transform", expression="temp - 2"),
+        ]
+        settings = make_settings()
+        save_variables(variables, settings)
+        settings.sync()
+        assert load_variables(make_settings()) == variables
+
+    def test_empty(self, make_settings) -> None:
+        assert load_variables(make_settings()) == []
+
+    def test_legacy_layout(self, make_settings) -> None:
+        settings = make_settings()
+        settings.setValue("variables/count", 2)
+        settings.setValue("variables/0/name", "temp")
+        settings.setValue("variables/0/csv_column", 3)
+        settings.setValue("variables/1/name", "hum")
+        settings.setValue("variables/1/source", "mqtt")
+        variables = load_variables(settings)
+        assert variables == [
+            VariableDefinition(name="temp", csv_column=3),
+            VariableDefinition(name="hum", source="mqtt"),
+        ]
+
+        save_variables(variables[:1], settings)
+        assert load_variables(settings) == variables[:1]
+        assert not settings.contains("variables/count")
+
+    def test_invalid_value_reads_as_default(self, make_settings) -> None:
+        settings = make_settings()
+        settings.setValue("variables/count", 1)
+        settings.setValue("variables/0/name", "temp")
+        settings.setValue("variables/0/unit", None)
+        settings.sync()
+        assert load_variables(make_settings())[0].unit == ""
@@ -0,0 +1,27 @@
+"""Tests for nibterm.logging.file_logger."""
+from __future__ import annotations
+
+import os
+
+from nibterm.logging.file_logger import FileLogger
+
+
+class TestFileLogger:
+    def test_lines_written_with_platform_line_endings(self, tmp_path) -> None:
+        path = tmp_path / "log.txt"
+        file_logger = FileLogger()
+        file_logger.start(path, "w")
+        file_logger.log_line("one")
+        file_logger.log_lines(["two", "three"])
+        file_logger.stop()
+        assert path.read_bytes() == os.linesep.join(["one", "two", "three", ""]).encode()
+
+    def test_unencodable_line_does_not_stall_writer(self, tmp_path) -> None:
+        path = tmp_path / "log.txt"
+        file_logger = FileLogger()
+        file_logger.start(path, "w")
+        file_logger.log_line("bad \ud800")
+        file_logger.log_line("after")
+        file_logger.flush()
+        file_logger.stop()
+        assert path.read_text(encoding="utf-8").splitlines() == ["bad ?", "after"]
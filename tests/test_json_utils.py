@@ -1,6 +1,8 @@
 """Tests for nibterm.data.json_utils."""
 from __future__ import annotations
 
+from PySide6.QtGui import QTextCursor, QTextDocument
+
 from nibterm.data.json_utils import (
     build_json_with_path_ranges,
     extract_json_value,
@@ -43,6 +45,11 @@ class TestBuildJsonWithPathRanges:
         assert "null" in text
         assert len(ranges) == 2
 
+    def test_ranges_match_text(self) -> None:
+        obj = {"a": [1, {"b": "x"}], "c": None}
+        text, ranges = build_json_with_path_ranges(obj)
+        assert [text[start:end] for start, end, _, _ in ranges] == ["1", '"x"', "null"]
+
     def test_empty_object(self) -> None:
         obj = {}
         text, ranges = build_json_with_path_ranges(obj)
@@ -50,6 +57,20 @@ class TestBuildJsonWithPathRanges:
         assert "{" in text
 
 
+    def test_ranges_select_values_in_qt(self, qapp) -> None:
+        # Qt positions count UTF-16 units; a non-BMP character must not shift them
+        obj = {"label": "\U0001f321 temp", "value": 21.5}
+        text, ranges = build_json_with_path_ranges(obj)
+        doc = QTextDocument(text)
+        selected = []
+        for start, end, _path, _key in ranges:
+            cursor = QTextCursor(doc)
+            cursor.setPosition(start)
+            cursor.setPosition(end, QTextCursor.MoveMode.KeepAnchor)
+            selected.append(cursor.selectedText())
+        assert selected == ['"\\ud83c\\udf21 temp"', "21.5"]
+
+
 class TestExtractJsonValue:
     def test_simple_path(self) -> None:
         data = {"temperature": 22.5}
@@ -79,6 +100,14 @@ class TestExtractJsonValue:
         data = {"values": [10, 20, 30]}
         assert extract_json_value(data, "$.values[1]") == 20.0
 
+    def test_index_into_non_list(self) -> None:
+        data = {"a": {"0": 1}}
+        assert extract_json_value(data, "$.a[0]") is None
+
+    def test_complex_path(self) -> None:
+        data = {"a b": [{"v": 5}]}
+        assert extract_json_value(data, '$["a b"][*].v') == 5.0
+
 
 class TestSanitizeVarName:
     def test_normal_name(self) -> None:
@@ -109,3 +138,12 @@ class TestUniqueVariableName:
 
     def test_empty_base(self) -> None:
         assert unique_variable_name("", set()) == "value"
+
+    def test_next_suffix(self) -> None:
+        used = {"x", "x_3"}
+        next_suffix: dict[str, int] = {}
+        names = []
+        for _ in range(3):
+            names.append(unique_variable_name("x", used, next_suffix))
+            used.add(names[-1])
+        assert names == ["x_2", "x_4", "x_5"]
@@ -0,0 +1,45 @@
+"""Tests for nibterm.main_window."""
+from __future__ import annotations
+
+import pytest
+from PySide6.QtCore import QSettings
+
+from nibterm.main_window import MainWindow
+
+
+@pytest.fixture
+def window(qapp, tmp_path):
+    # Keep the user's real settings out of it
+    QSettings.setPath(QSettings.Format.NativeFormat, QSettings.Scope.UserScope, str(tmp_path))
+    win = MainWindow()
+    yield win
+    win.close()
+    qapp.processEvents()
+
+
+class TestSerialToggle:
+    def _open(self, window, monkeypatch) -> None:
+        # The signal sequence PortManager.open() emits on success
+        monkeypatch.setattr(window._port_manager, "is_open", lambda: True)
+        window._port_manager.reconnecting.emit(False)
+        window._port_manager.connection_changed.emit(True)
+
+    def test_manual_connect(self, window, monkeypatch) -> None:
+        action = window._action_connect_toggle
+        self._open(window, monkeypatch)
+        assert action.isChecked()
+        assert action.text() == "Serial Connected"
+
+        monkeypatch.setattr(window._port_manager, "is_open", lambda: False)
+        window._port_manager.connection_changed.emit(False)
+        assert not action.isChecked()
+        assert action.text() == "Serial Disconnected"
+
+    def test_reconnect_after_waiting(self, window, monkeypatch) -> None:
+        action = window._action_connect_toggle
+        window._port_manager.reconnecting.emit(True)
+        assert action.isChecked()
+        assert action.text() == "Serial Waiting"
+        self._open(window, monkeypatch)
+        assert action.isChecked()
+        assert action.text() == "Serial Connected"
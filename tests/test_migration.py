@@ -0,0 +1,53 @@
+"""Tests for nibterm.config.migration."""
+from __future__ import annotations
+
+from nibterm.config import settings_keys as SK
+from nibterm.config.migration import _migrate_to_unified_variables, migrate_settings
+from nibterm.config.variable import load_variables
+
+
+class TestUnifiedVariablesMigration:
+    def test_legacy_keys(self, make_settings) -> None:
+        settings = make_settings()
+        settings.setValue(SK.PLOT_COLUMN_NAMES, " 0 = temp ; bad ; x=skip; 1=hum; 2=temp; 3=mq")
+        settings.setValue(SK.PLOT_MQTT_COLUMN_INDICES, "3")
+        settings.setValue(SK.MQTT_PLOT_VAR_COUNT, 2)
+        settings.setValue(SK.MQTT_PLOT_VAR_TOPIC.format(0), "room/1")
+        settings.setValue(SK.MQTT_PLOT_VAR_PATH.format(0), "$.t")
+        settings.setValue(SK.MQTT_PLOT_VAR_NAME.format(0), "temp")
+        settings.setValue(SK.MQTT_PLOT_VAR_PATH.format(1), "$.h")
+        settings.setValue(SK.PLOT_TRANSFORM, "f = temp * 1.8 + 32; hum * 2")
+
+        _migrate_to_unified_variables(settings)
+
+        variables = load_variables(settings)
+        assert [(v.name, v.source) for v in variables] == [
+            ("temp", "serial"),
+            ("hum", "serial"),
+            ("temp_2", "serial"),
+            ("temp_3", "mqtt"),
+            ("mqtt_1", "mqtt"),
+            ("f", "transform"),
+            ("hum * 2", "transform"),
+        ]
+        assert variables[2].csv_column == 2
+        assert variables[3].mqtt_topic == "room/1"
+        assert variables[5].expression == "temp * 1.8 + 32"
+
+    def test_nothing_to_migrate(self, make_settings) -> None:
+        settings = make_settings()
+        _migrate_to_unified_variables(settings)
+        assert load_variables(settings) == []
+
+
+class TestMigrateSettings:
+    def test_runs_once_per_store(self, make_settings) -> None:
+        settings = make_settings()
+        settings.setValue(SK.PLOT_COLUMN_NAMES, "0=temp")
+        migrate_settings(settings)
+        assert [v.name for v in load_variables(settings)] == ["temp"]
+
+        # A second call in the same process does not touch the store again.
+        settings.remove(SK.VAR_ARRAY)
+        migrate_settings(settings)
+        assert load_variables(settings) == []
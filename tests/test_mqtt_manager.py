@@ -0,0 +1,34 @@
+"""Tests for nibterm.mqtt.manager."""
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+from nibterm.mqtt.manager import MQTTManager
+
+
+def _deliver(manager: MQTTManager, topic: str, payload: bytes) -> None:
+    manager._on_message(None, None, SimpleNamespace(topic=topic, payload=payload))
+
+
+class TestMessageBatching:
+    def test_flush_emits_one_batch(self) -> None:
+        manager = MQTTManager()
+        batches: list[list] = []
+        manager.messages_batch.connect(batches.append)
+        _deliver(manager, "a", b"1")
+        _deliver(manager, "b", b"2")
+        assert batches == []
+
+        manager._flush_inbox()
+        assert batches == [[("a", b"1"), ("b", b"2")]]
+        manager._flush_inbox()
+        assert len(batches) == 1
+
+    def test_per_message_signal_still_emitted(self) -> None:
+        manager = MQTTManager()
+        received: list[tuple[str, bytes]] = []
+        manager.message_received.connect(lambda t, p: received.append((t, p)))
+        _deliver(manager, "a", b"1")
+        _deliver(manager, "a", b"2")
+        manager._flush_inbox()
+        assert received == [("a", b"1"), ("a", b"2")]
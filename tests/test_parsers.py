@@ -0,0 +1,28 @@
+"""Tests for nibterm.data.parsers."""
+from __future__ import annotations
+
+import math
+
+from nibterm.data.parsers import parse_csv_line, parse_regex_value
+
+
+class TestParseCsvLine:
+    def test_all_columns(self) -> None:
+        assert parse_csv_line(" 1 ,x,, -2.5e1 ", ",") == {0: 1.0, 3: -25.0}
+
+    def test_selected_columns(self) -> None:
+        assert parse_csv_line("1,2,3,4,5", ",", column_indices=[3, 1, 9, -1]) == {3: 4.0, 1: 2.0}
+
+    def test_special_floats(self) -> None:
+        values = parse_csv_line("nan;inf;-Infinity", ";")
+        assert math.isnan(values[0])
+        assert values[1] == math.inf
+        assert values[2] == -math.inf
+
+
+class TestParseRegexValue:
+    def test_group(self) -> None:
+        assert parse_regex_value("t=21.5 h=40", r"h=(\d+)", 1) == 40.0
+
+    def test_invalid_pattern(self) -> None:
+        assert parse_regex_value("abc", r"(", 1) is None
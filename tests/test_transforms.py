@@ -5,7 +5,7 @@ import math
 
 import pytest
 
-from nibterm.data.transforms import safe_eval
+from nibterm.data.transforms import get_expression_variable_names, safe_eval
 
 
 class TestSafeEval:
@@ -37,3 +37,30 @@ class TestSafeEval:
     def test_unsupported_function(self) -> None:
         with pytest.raises(ValueError, match="Unsupported function"):
             safe_eval("eval('1')", {})
+
+    def test_repeated_evaluation(self) -> None:
+        assert safe_eval("x + y", {"x": 1.0, "y": 2.0, "z": 9.0}) == 3.0
+        assert safe_eval("x + y", {"x": 4.0, "y": 5.0}) == 9.0
+
+    def test_missing_variable(self) -> None:
+        with pytest.raises(NameError):
+            safe_eval("x + y", {"x": 1.0})
+
+    def test_variable_shadows_constant(self) -> None:
+        assert safe_eval("e * 2", {"e": 3.0}) == 6.0
+        assert safe_eval("e * 2", {}) == pytest.approx(2 * math.e)
+
+
+class TestExpressionVariableNames:
+    def test_skips_functions_and_constants(self) -> None:
+        assert get_expression_variable_names("sin(x) + max(y, 2) * pi") == {"x", "y"}
+        # Only the allowed functions are skipped; any other name counts.
+        assert get_expression_variable_names("foo(x)") == {"foo", "x"}
+
+    def test_invalid_expression(self) -> None:
+        assert get_expression_variable_names("1 +") == set()
+
+    def test_result_is_a_fresh_set(self) -> None:
+        names = get_expression_variable_names("a + b")
+        names.add("c")
+        assert get_expression_variable_names("a + b") == {"a", "b"}
@@ -62,6 +62,21 @@ class TestVariableManagerCSV:
         values, updated = mgr.process_serial_line("1.0,2.0")
         assert "x" not in updated
 
+    def test_has_serial_variables(self) -> None:
+        assert self._make_manager([VariableDefinition(name="t", source="serial")]).has_serial_variables()
+        assert not self._make_manager([VariableDefinition(name="m", source="mqtt")]).has_serial_variables()
+
+    def test_csv_batch(self) -> None:
+        variables = [
+            VariableDefinition(name="x", source="serial", csv_column=0),
+            VariableDefinition(name="y", source="serial", csv_column=1),
+        ]
+        mgr = self._make_manager(variables)
+        results = mgr.process_serial_batch(["1.0,2.0", "3.0", "junk"])
+        assert [r[0]["x"] for r in results] == [1.0, 3.0, 3.0]
+        assert [r[1] for r in results] == [{"x", "y"}, {"x"}, set()]
+        assert mgr.get_last_serial_line() == "junk"
+
 
 class TestVariableManagerJSON:
     """Test JSON serial parsing."""
@@ -200,3 +215,61 @@ class TestVariableManagerTransforms:
         values, updated = mgr.process_mqtt_values({"x": 7.0})
         assert values["doubled"] == pytest.approx(14.0)
         assert "doubled" in updated
+
+
+class TestVariableManagerEditing:
+    """Test edits that keep transforms consistent."""
+
+    def _make_manager(self, variables):
+        from nibterm.data.variable_manager import VariableManager
+
+        settings = MagicMock()
+        settings.value = MagicMock(return_value=0)
+
+        with patch("nibterm.data.variable_manager.load_variables", return_value=list(variables)):
+            with patch("nibterm.data.variable_manager.SerialParserConfig.from_qsettings",
+                       return_value=SerialParserConfig()):
+                mgr = VariableManager(settings)
+        return mgr
+
+    def _variables(self):
+        return [
+            VariableDefinition(name="raw", source="serial", csv_column=0),
+            VariableDefinition(name="other", source="serial", csv_column=1),
+            VariableDefinition(name="scaled", source="transform", expression="raw * 2"),
+            VariableDefinition(name="offset", source="transform", expression="scaled + 1"),
+        ]
+
+    def test_remove_drops_dependent_transforms(self) -> None:
+        mgr = self._make_manager(self._variables())
+        mgr.remove_variable("raw")
+        assert mgr.get_variable_names() == ["other"]
+
+    def test_rename_rewrites_transforms(self) -> None:
+        mgr = self._make_manager(self._variables())
+        mgr.update_variable("raw", VariableDefinition(name="adc", source="serial", csv_column=0))
+        assert mgr.get_variable_names() == ["adc", "other", "scaled", "offset"]
+        assert mgr.variables[2].expression == "adc * 2"
+        values, _ = mgr.process_serial_line("3,4")
+        assert values["offset"] == pytest.approx(7.0)
+
+    def test_only_affected_transforms_update(self) -> None:
+        variables = [
+            VariableDefinition(name="total", source="transform", expression="scaled + other"),
+            *self._variables(),
+        ]
+        mgr = self._make_manager(variables)
+        values, updated = mgr.process_mqtt_values({"other": 1.0})
+        assert updated == {"other"}
+        values, updated = mgr.process_mqtt_values({"raw": 2.0})
+        assert updated == {"raw", "scaled", "offset", "total"}
+        assert values["total"] == pytest.approx(5.0)
+
+    def test_edits_are_saved_once_on_flush(self) -> None:
+        mgr = self._make_manager(self._variables())
+        settings = mgr._settings
+        mgr.add_variable(VariableDefinition(name="a", source="mqtt"))
+        mgr.add_variable(VariableDefinition(name="b", source="mqtt"))
+        settings.beginWriteArray.assert_not_called()
+        mgr.save()
+        settings.beginWriteArray.assert_called_once()